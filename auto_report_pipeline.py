@@ -1,11 +1,22 @@
 # To be used with extract, report_generator, transform, utils
 from auto_report_pipeline.extract import load_csv
-from auto_report_pipeline.transform import generate_column_report, run_basic_insights
-from auto_report_pipeline.report_generator import assemble_report, save_report
+from auto_report_pipeline.pipeline import (
+    load_input,
+    read_io_from_config,
+    render_report,
+    resolve_engine,
+    resolve_output_format,
+    resolve_processes,
+    resolve_profile_path,
+    resolve_row_filter,
+    resolve_section_cache,
+    resolve_segmenting,
+)
+from auto_report_pipeline.watch import watch_report
+from auto_report_pipeline.server import serve
 import glob
 import argparse
 import os
-import csv
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -17,78 +28,44 @@ DEFAULT_CONFIG_PATH = str(
 ANALYTICS_ENABLED = True
 
 
-def read_io_from_config(config_path: str) -> tuple[str | None, str | None]:
-    """Read INPUT and OUTPUT from the report_config CSV.
-
-    This scans lines *before* the header row that begins with `COLUMN` and
-    returns absolute paths resolved relative to the config file's directory.
-    """
-    input_path = None
-    output_path = None
-    cfg_dir = Path(config_path).resolve().parent
-
-    with open(config_path, newline="", encoding="utf-8") as fh:
-        reader = csv.reader(fh)
-        for row in reader:
-            if not row:
-                continue
-            key = (row[0] or "").strip().lower()
-            if key == "column":
-                break
-            if key == "input" and len(row) >= 2 and row[1].strip():
-                input_path = row[1].strip()
-            if key == "output" and len(row) >= 2 and row[1].strip():
-                output_path = row[1].strip()
-
-    def _resolve(p: str | None) -> str | None:
-        if not p:
-            return None
-        pth = Path(p)
-        if not pth.is_absolute():
-            if (
-                cfg_dir.name == "csv_files"
-                and len(pth.parts) > 0
-                and pth.parts[0] == "csv_files"
-            ):
-                pth = Path(*pth.parts[1:]) if len(pth.parts) > 1 else Path(".")
-            pth = (cfg_dir / pth).resolve()
-        return str(pth)
-
-    return _resolve(input_path), _resolve(output_path)
-
-
-def run_auto_report(input_path: str, config_path: str, output_path: str):
-    df = load_csv(input_path)
-    #if df.columns.duplicated().any():
-
-    def _make_unique(cols):
-        seen = {}
-        out = []
-        for c in cols:
-            name = str(c)
-            if name in seen:
-                seen[name] += 1
-                out.append(f"{name}.{seen[name]}")
-            else:
-                seen[name] = 0
-                out.append(name)
-        return out
-
-    df = df.copy()
-    df.columns = _make_unique(df.columns)
+def run_auto_report(
+    input_path: str,
+    config_path: str,
+    output_path: str,
+    engine: str | None = None,
+    section_cache_dir: str | None = None,
+    profile_path: str | None = None,
+    processes: int | None = None,
+    segment_by: str | None = None,
+    segment_output: str | None = None,
+    output_format: str | None = None,
+    required_columns: str | None = None,
+    filter_column: str | None = None,
+    filter_value: str | None = None,
+):
+    segment_by, segment_output = resolve_segmenting(
+        config_path, segment_by, segment_output
+    )
+    df = load_input(
+        input_path,
+        engine=resolve_engine(config_path, engine),
+        row_filter=resolve_row_filter(
+            config_path, required_columns, filter_column, filter_value
+        ),
+    )
     config_df = load_csv(config_path)
-
-    report_blocks = generate_column_report(df, config_df)
-    final_report = assemble_report(report_blocks)
-    save_report(final_report, output_path)
-    if ANALYTICS_ENABLED:
-        try:
-            import os
-
-            out_dir = os.path.dirname(output_path) or "."
-            run_basic_insights(df, config_df=config_df, output_dir=out_dir)
-        except Exception as e:
-            print(f"[insights] Skipped due to error: {e}")
+    render_report(
+        df,
+        config_df,
+        output_path,
+        analytics=ANALYTICS_ENABLED,
+        section_cache=resolve_section_cache(config_path, section_cache_dir),
+        profile_path=resolve_profile_path(config_path, profile_path),
+        processes=resolve_processes(config_path, processes),
+        segment_by=segment_by,
+        segment_output=segment_output,
+        output_format=resolve_output_format(config_path, output_format),
+    )
 
 
 if __name__ == "__main__":
@@ -111,8 +88,126 @@ if __name__ == "__main__":
         action="store_true",
         help="If set, do NOT read INPUT/OUTPUT from report_config; use CLI values only",
     )
+    parser.add_argument(
+        "--engine",
+        default=None,
+        choices=["default", "pyarrow"],
+        help="(Optional) CSV/string engine; overrides the ENGINE row of report_config",
+    )
+    parser.add_argument(
+        "--section-cache",
+        default=None,
+        help="(Optional) Directory for memoized report sections; overrides SECTION_CACHE in report_config",
+    )
+    parser.add_argument(
+        "--profile-path",
+        default=None,
+        help="(Optional) Write the per-column profile CSV here; overrides PROFILE in report_config",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="(Optional) Split rows across N worker processes; overrides PROCESSES in report_config",
+    )
+    parser.add_argument(
+        "--segment-by",
+        default=None,
+        help="(Optional) Column to segment every section by; overrides SEGMENT BY in report_config",
+    )
+    parser.add_argument(
+        "--segment-output",
+        default=None,
+        choices=["columns", "files"],
+        help="(Optional) Per-segment columns in one report, or one report file per segment",
+    )
+    parser.add_argument(
+        "--output-format",
+        default=None,
+        choices=["csv", "csv.gz", "csv.zst", "parquet", "jsonl"],
+        help="(Optional) Format of the report, crosstabs and correlations; overrides OUTPUT_FORMAT",
+    )
+    parser.add_argument(
+        "--required-columns",
+        default=None,
+        help="(Optional) '|'-separated columns that must exist and be non-blank; overrides REQUIRED_COLUMNS",
+    )
+    parser.add_argument(
+        "--filter-column",
+        default=None,
+        help="(Optional) Drop rows whose value in this column equals --filter-value; overrides FILTER_COLUMN",
+    )
+    parser.add_argument(
+        "--filter-value",
+        default=None,
+        help="(Optional) Value dropped from --filter-column; overrides FILTER_VALUE",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate the report whenever INPUT or the config changes",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="(--watch) Seconds between file change checks (default 1.0)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        help="(--watch) Seconds a change must settle before re-running (default 0.5)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a local HTTP report server (POST /report) instead of a single run",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="(--serve) Bind address")
+    parser.add_argument("--port", type=int, default=8765, help="(--serve) Port")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="(--serve) Report worker threads"
+    )
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=512,
+        help="(--serve) Memory budget for cached parsed inputs, in MB",
+    )
     args = parser.parse_args()
 
+    if args.serve:
+        serve(
+            host=args.host,
+            port=args.port,
+            max_workers=args.workers,
+            cache_bytes=args.cache_mb * 1024 * 1024,
+        )
+        raise SystemExit(0)
+
+    if args.watch:
+        watch_report(
+            args.config_path,
+            input_path=args.input_path,
+            output_path=args.output_path,
+            use_config_io=not args.no_config_io,
+            engine=args.engine,
+            section_cache_dir=args.section_cache,
+            profile_path=args.profile_path,
+            processes=args.processes,
+            segment_by=args.segment_by,
+            segment_output=args.segment_output,
+            output_format=args.output_format,
+            required_columns=args.required_columns,
+            filter_column=args.filter_column,
+            filter_value=args.filter_value,
+            interval=args.poll_interval,
+            debounce=args.debounce,
+            analytics=ANALYTICS_ENABLED,
+        )
+        raise SystemExit(0)
+
     # Resolve INPUT/OUTPUT from report_config unless explicitly disabled
     cfg_input, cfg_output = (None, None)
     if not args.no_config_io:
@@ -140,4 +235,14 @@ if __name__ == "__main__":
         input_path=input_path,
         config_path=args.config_path,
         output_path=output_path,
+        engine=args.engine,
+        section_cache_dir=args.section_cache,
+        profile_path=args.profile_path,
+        processes=args.processes,
+        segment_by=args.segment_by,
+        segment_output=args.segment_output,
+        output_format=args.output_format,
+        required_columns=args.required_columns,
+        filter_column=args.filter_column,
+        filter_value=args.filter_value,
     )
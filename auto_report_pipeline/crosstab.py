@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+CROSSTAB_FORMATS = ("wide", "long")
+LONG_HEADER = ["source_column", "target_column", "source_value", "target_value", "count"]
+
+
+@dataclass
+class SparseCrosstab:
+    """
+    Contingency table in COO form: only observed (row, col) pairs are stored.
+
+    `row_labels` / `col_labels` are sorted like pd.crosstab's index/columns;
+    `rows`, `cols` and `counts` hold one entry per non-zero cell, ordered by
+    (row, col).
+    """
+
+    row_labels: list
+    col_labels: list
+    rows: np.ndarray
+    cols: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.row_labels), len(self.col_labels)
+
+    @property
+    def cells(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def dense(self) -> np.ndarray:
+        table = np.zeros(self.shape, dtype=np.int64)
+        table[self.rows, self.cols] = self.counts
+        return table
+
+    def cramers_v(self) -> float:
+        """
+        Bias-corrected Cramér's V from the non-zero cells only, using
+        chi2 = N * (sum(O^2 / (r_i * c_j)) - 1).
+        """
+        observed = self.counts.astype(float)
+        row_totals = np.bincount(self.rows, weights=observed, minlength=self.shape[0])
+        col_totals = np.bincount(self.cols, weights=observed, minlength=self.shape[1])
+        # Levels can be empty when counts were resampled (bootstrap)
+        n_rows = int((row_totals > 0).sum())
+        n_cols = int((col_totals > 0).sum())
+        if n_rows < 2 or n_cols < 2:
+            return np.nan
+        total = float(self.total)
+        if total <= 1:
+            return np.nan
+        seen = observed > 0
+        ratio = observed[seen] ** 2 / (
+            row_totals[self.rows[seen]] * col_totals[self.cols[seen]]
+        )
+        chi_square = total * (ratio.sum() - 1.0)
+
+        phi2 = chi_square / total
+        phi2_corrected = max(0.0, phi2 - ((n_cols - 1) * (n_rows - 1)) / (total - 1))
+        rows_corrected = n_rows - ((n_rows - 1) ** 2) / (total - 1)
+        cols_corrected = n_cols - ((n_cols - 1) ** 2) / (total - 1)
+        denom = min((cols_corrected - 1), (rows_corrected - 1))
+        return float(np.sqrt(phi2_corrected / denom)) if denom > 0 else np.nan
+
+    def wide_rows(self, index_name: str) -> list:
+        """ Header + one row per source value, matching the old pd.crosstab dump """
+        out = [[index_name] + list(self.col_labels)]
+        for label, row in zip(self.row_labels, self.dense().tolist()):
+            out.append([label] + row)
+        return out
+
+    def cell_rows(self) -> list:
+        """ (source_value, target_value, count) per non-zero cell """
+        return list(
+            zip(
+                np.asarray(self.row_labels, dtype=object)[self.rows].tolist(),
+                np.asarray(self.col_labels, dtype=object)[self.cols].tolist(),
+                self.counts.tolist(),
+            )
+        )
+
+    def long_rows(self, src_col: str, tgt_col: str) -> list:
+        """ cell_rows() prefixed with the column pair (LONG_HEADER layout) """
+        return [(src_col, tgt_col) + cell for cell in self.cell_rows()]
+
+    def long_frame(self, src_col: str, tgt_col: str) -> pd.DataFrame:
+        """ long_rows() as a DataFrame; values as text so pairs share one schema """
+        n = len(self.counts)
+        return pd.DataFrame(
+            {
+                "source_column": [src_col] * n,
+                "target_column": [tgt_col] * n,
+                "source_value": np.asarray(self.row_labels, dtype=object)[self.rows].astype(str),
+                "target_value": np.asarray(self.col_labels, dtype=object)[self.cols].astype(str),
+                "count": self.counts,
+            },
+            columns=LONG_HEADER,
+        )
+
+
+def sparse_crosstab(a: pd.Series, b: pd.Series) -> SparseCrosstab:
+    """
+    Count co-occurrences of two aligned columns (NA pairs dropped) from
+    factorized codes, without materializing the dense rows x cols table.
+    """
+    a_codes, a_labels = pd.factorize(a, sort=True)
+    b_codes, b_labels = pd.factorize(b, sort=True)
+    valid = (a_codes >= 0) & (b_codes >= 0)
+    n_cols = max(len(b_labels), 1)
+    pairs = a_codes[valid].astype(np.int64) * n_cols + b_codes[valid]
+    keys, counts = np.unique(pairs, return_counts=True)
+    rows, cols = np.divmod(keys, n_cols)
+    return SparseCrosstab(
+        row_labels=list(a_labels),
+        col_labels=list(b_labels),
+        rows=rows,
+        cols=cols,
+        counts=counts.astype(np.int64),
+    )
@@ -1,15 +1,68 @@
+import csv
+import re
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
 import pandas as pd
 import numpy as np
 
+from auto_report_pipeline.utils import _as_text, _norm_header
+
+ENGINES = ("default", "pyarrow")
+
 
 def _normalize_headers(cols: pd.Index) -> pd.Index:
     return cols.str.strip().str.lower().str.replace(" ", "_", regex=False)
 
 
-def load_csv(path: str) -> pd.DataFrame:
+def _read_csv_pyarrow(path: str) -> pd.DataFrame:
+    """
+    Multithreaded pyarrow CSV reader with Arrow-backed dtypes. Whitespace
+    trimming and blank -> NA are done with Arrow string kernels per column
+    instead of a Python-level map over every cell.
+    """
+    df = pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
+    return _tidy_arrow_frame(df)
+
+
+def _tidy_arrow_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = _normalize_headers(df.columns.astype(str))
+    return _tidy_text_columns(df)
+
+
+def _tidy_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """ `_tidy_values` for string columns, with vectorized string methods """
+    for col in df.columns:
+        if pd.api.types.is_string_dtype(df[col].dtype):
+            stripped = df[col].str.strip()
+            df[col] = stripped.mask(stripped == "")
+    return df
+
+
+def _tidy_values(df: pd.DataFrame) -> pd.DataFrame:
+    """ Blank cells -> NaN and surrounding whitespace trimmed """
+    df = df.replace(r"^\s*$", np.nan, regex=True)
+    return df.map(lambda x: x.strip() if isinstance(x, str) else x)
+
+
+def _has_config_header(path: str, max_rows: int = 100) -> bool:
+    """ True if a `COLUMN` header row (report_config layout) is among the first rows """
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        for i, row in enumerate(csv.reader(fh)):
+            if i >= max_rows:
+                break
+            if row and row[0].strip().lower() == "column":
+                return True
+    return False
+
+
+def load_csv(path: str, engine: str = "default") -> pd.DataFrame:
     """
     CSV loader used for BOTH data and config files.
     Behavior:
+    0) engine="pyarrow" reads data files with the pyarrow CSV reader and
+       Arrow-backed string dtypes (falls back to the default reader when
+       pyarrow is not installed or the file is a report config).
     1) First, try normal header=0 read.
     2) If the resulting columns do NOT include 'column' but the file actually
        contains a header row for the report config further down, re-parse by
@@ -17,6 +70,21 @@ def load_csv(path: str) -> pd.DataFrame:
        using that row as the header.
     3) Normalize headers and basic whitespace/blank handling.
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    if engine == "pyarrow":
+        try:
+            df = _read_csv_pyarrow(path)
+        except ImportError:
+            print("[extract] pyarrow not installed; using the default CSV reader.")
+        except Exception as e:
+            # Ragged report_config files (INPUT/OUTPUT preamble) need the fallback below
+            if not _has_config_header(path):
+                print(f"[extract] pyarrow read failed ({e}); using the default CSV reader.")
+        else:
+            if "column" not in df.columns:
+                return df
+
     df = pd.read_csv(path)
     df.columns = _normalize_headers(df.columns)
 
@@ -45,6 +113,194 @@ def load_csv(path: str) -> pd.DataFrame:
             .str.replace(" ", "_", regex=False)
         )
 
-    df = df.replace(r"^\s*$", np.nan, regex=True)
-    df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-    return df
+    return _tidy_values(df)
+
+
+def missing_columns(columns, required_cols) -> list:
+    """ Required names (matched like report_config COLUMN names) absent from `columns` """
+    present = {_norm_header(c) for c in columns}
+    return [c for c in required_cols if _norm_header(c) not in present]
+
+
+def validate_schema(df: pd.DataFrame, required_cols: list):
+    """ Raise ValueError if any of `required_cols` is missing from `df` """
+    missing = missing_columns(df.columns, required_cols)
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+
+def transform_data(
+    df: pd.DataFrame,
+    required_cols: list,
+    filter_col: str | None = None,
+    filter_value: str | None = None,
+) -> pd.DataFrame:
+    """
+    Drop rows with a blank value in any required column, and rows whose
+    `filter_col` equals `filter_value` (trimmed, case-insensitive).
+    """
+    validate_schema(df, list(required_cols) + ([filter_col] if filter_col else []))
+    lookup = {_norm_header(c): c for c in df.columns}
+    required = [lookup[_norm_header(c)] for c in required_cols]
+    keep = df[required].notna().all(axis=1).to_numpy(dtype=bool, copy=True)
+    if filter_col and filter_value is not None:
+        values = _as_text(df[lookup[_norm_header(filter_col)]]).str.strip().str.lower()
+        keep &= (values != str(filter_value).strip().lower()).to_numpy(dtype=bool)
+    return df[keep]
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """
+    Load-time schema check and row filter (REQUIRED_COLUMNS / FILTER_COLUMN /
+    FILTER_VALUE). Rows with a blank required column, and rows whose
+    filter column equals `filter_value`, are dropped.
+    """
+
+    required_columns: tuple = ()
+    filter_column: Optional[str] = None
+    filter_value: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.required_columns or self.filter_column)
+
+    @property
+    def columns(self) -> list:
+        return list(self.required_columns) + (
+            [self.filter_column] if self.filter_column else []
+        )
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        return transform_data(
+            df, list(self.required_columns), self.filter_column, self.filter_value
+        )
+
+
+def parse_column_list(value: Optional[str]) -> tuple:
+    """ "place_id|ticket_type" (or comma/semicolon separated) -> ("place_id", "ticket_type") """
+    if not value:
+        return ()
+    return tuple(v.strip() for v in re.split(r"[|,;]", value) if v.strip())
+
+
+def read_header(path: str) -> list[str]:
+    """ Normalized column names from the first line only (no data is parsed) """
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        header = next(csv.reader(fh), [])
+    return list(_normalize_headers(pd.Index(header, dtype=object).astype(str)))
+
+
+def _raw_header(path: str) -> list[str]:
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        return next(csv.reader(fh), [])
+
+
+def _iter_default_chunks(path: str, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    # Read as text: per-chunk type inference would turn "02134" into 2134.0
+    # in chunks that happen to be all digits (see _ColumnKinds)
+    with pd.read_csv(path, chunksize=chunk_rows, dtype=str) as reader:
+        for chunk in reader:
+            chunk.columns = _normalize_headers(chunk.columns)
+            yield _tidy_text_columns(chunk)
+
+
+def _iter_pyarrow_chunks(path: str, block_bytes: int = 16 << 20) -> Iterator[pd.DataFrame]:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    # Every column as text, so a later block can never disagree with the
+    # types inferred from the first one
+    convert = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in _raw_header(path)},
+        strings_can_be_null=True,
+    )
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=block_bytes),
+        convert_options=convert,
+    )
+    for batch in reader:
+        yield _tidy_arrow_frame(batch.to_pandas(types_mapper=pd.ArrowDtype))
+
+
+class _ColumnKinds:
+    """
+    Column types decided once over every chunk read (kept or dropped), the
+    way a single full read infers them: a column is numeric only if all of
+    its non-blank cells parse as numbers.
+    """
+
+    def __init__(self):
+        self.numeric: dict[str, bool] = {}
+        self.has_na: dict[str, bool] = {}
+
+    def update(self, chunk: pd.DataFrame):
+        for col in chunk.columns:
+            values = chunk[col]
+            if self.numeric.get(col, True):
+                # Via object: coercing Arrow strings yields NaN, not NA, on failure
+                present = values.dropna().astype(object)
+                parsed = pd.to_numeric(present, errors="coerce")
+                self.numeric[col] = bool(parsed.notna().all())
+            self.has_na[col] = self.has_na.get(col, False) or bool(values.isna().any())
+
+    def restore(self, df: pd.DataFrame) -> pd.DataFrame:
+        for col in df.columns:
+            if not self.numeric.get(col, False):
+                continue
+            values = pd.to_numeric(df[col])
+            if self.has_na[col] and not isinstance(values.dtype, pd.ArrowDtype):
+                # The default reader loads integers with blanks as float64
+                values = values.astype("float64")
+            df[col] = values
+        return df
+
+
+def load_csv_filtered(
+    path: str,
+    row_filter: RowFilter,
+    engine: str = "default",
+    chunk_rows: int = 100_000,
+) -> tuple[pd.DataFrame, dict]:
+    """
+    Load a data file applying `row_filter` while reading.
+
+    Required/filter columns are checked against the header line before any
+    data is parsed (ValueError on a missing column). Rows are then read in
+    chunks and filtered chunk by chunk, so dropped rows are never held in
+    memory all at once. Chunks are parsed as text and numeric columns are
+    converted once at the end, so values match a plain `load_csv`. Returns (kept rows, {"rows_read", "rows_kept"}).
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    header = read_header(path)
+    missing = missing_columns(header, row_filter.columns)
+    if missing:
+        raise ValueError(f"{path}: missing required column(s): {', '.join(missing)}")
+
+    def _filtered(chunks):
+        kept, read = [], 0
+        for chunk in chunks:
+            read += len(chunk)
+            kinds.update(chunk)
+            kept.append(row_filter.apply(chunk))
+        return kept, read
+
+    kept = None
+    kinds = _ColumnKinds()
+    if engine == "pyarrow":
+        try:
+            kept, read = _filtered(_iter_pyarrow_chunks(path))
+        except ImportError:
+            print("[extract] pyarrow not installed; using the default CSV reader.")
+        except Exception as e:
+            print(f"[extract] pyarrow streaming read failed ({e}); using the default CSV reader.")
+            kinds = _ColumnKinds()
+    if kept is None:
+        kept, read = _filtered(_iter_default_chunks(path, chunk_rows))
+
+    if kept:
+        df = kinds.restore(pd.concat(kept, ignore_index=True))
+    else:
+        df = pd.DataFrame(columns=header)
+    return df, {"rows_read": read, "rows_kept": len(df)}
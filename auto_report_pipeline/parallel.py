@@ -0,0 +1,112 @@
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import pandas as pd
+
+from auto_report_pipeline.transform import (
+    _column_state,
+    _finalize_column_section,
+    _merge_column_states,
+    _normalize_report_config,
+    _resolve_report_columns,
+)
+
+# Per-process state set by _init_worker. With the "fork" start method the
+# frame is inherited copy-on-write instead of being pickled to every worker.
+_WORKER: dict = {}
+
+
+def _init_worker(frame: pd.DataFrame, columns: list):
+    _WORKER["frame"] = frame
+    _WORKER["columns"] = columns
+
+
+def _map_partition(start: int, stop: int) -> list:
+    """ Column states for rows [start, stop) of the shared frame """
+    frame = _WORKER["frame"]
+    return [
+        _column_state(frame[resolved_col].iloc[start:stop], entries)
+        for _, resolved_col, entries in _WORKER["columns"]
+    ]
+
+
+def row_partitions(total_rows: int, partitions: int) -> list[tuple[int, int]]:
+    """ Split [0, total_rows) into at most `partitions` contiguous, near-equal blocks """
+    partitions = max(1, min(partitions, total_rows))
+    step, extra = divmod(total_rows, partitions)
+    bounds = []
+    start = 0
+    for i in range(partitions):
+        stop = start + step + (1 if i < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def generate_column_report_parallel(
+    report_df: pd.DataFrame,
+    config_df: pd.DataFrame,
+    processes: int = 4,
+    partitions: Optional[int] = None,
+    section_cache=None,
+) -> list:
+    """
+    Row-partitioned map-reduce variant of generate_column_report.
+
+    The input is split into contiguous row blocks; a process pool computes
+    partial column states per block (counts, match counts, duplicate value
+    counts, sum/count for averages, ordered clean rows) and the states are
+    merged in row order and finalized, producing exactly the same sections
+    as the single-pass report. Useful when a config has a few very heavy
+    columns that per-column parallelism cannot spread out.
+    """
+    total_rows = len(report_df)
+    cfg = _normalize_report_config(config_df)
+    resolved = _resolve_report_columns(report_df, cfg)
+
+    results: list = [None] * len(resolved)
+    keys: dict[int, str] = {}
+    pending = []
+    for i, (col_name, resolved_col, entries) in enumerate(resolved):
+        if section_cache is not None:
+            keys[i] = section_cache.key(col_name, report_df[resolved_col], entries)
+            results[i] = section_cache.get(keys[i])
+        if results[i] is None:
+            pending.append(i)
+
+    if pending:
+        work = [resolved[i] for i in pending]
+        needed = list(dict.fromkeys(resolved_col for _, resolved_col, _ in work))
+        frame = report_df[needed]
+        bounds = row_partitions(total_rows, partitions or processes * 2)
+
+        if processes <= 1 or len(bounds) == 1:
+            _init_worker(frame, work)
+            try:
+                partials = [_map_partition(a, b) for a, b in bounds]
+            finally:
+                _WORKER.clear()
+        else:
+            ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else None
+            with ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=ctx,
+                initializer=_init_worker,
+                initargs=(frame, work),
+            ) as pool:
+                futures = [pool.submit(_map_partition, a, b) for a, b in bounds]
+                partials = [f.result() for f in futures]
+
+        for j, i in enumerate(pending):
+            state = partials[0][j]
+            for part in partials[1:]:
+                state = _merge_column_states(state, part[j])
+            section = _finalize_column_section(resolved[i][0], state, total_rows)
+            if section_cache is not None:
+                section_cache.put(keys[i], section)
+            results[i] = section
+
+    if section_cache is not None:
+        section_cache.report()
+    return [[["Total rows", "", total_rows]]] + results
@@ -0,0 +1,316 @@
+import csv
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from auto_report_pipeline.extract import (
+    ENGINES,
+    RowFilter,
+    load_csv,
+    load_csv_filtered,
+    parse_column_list,
+)
+from auto_report_pipeline.transform import generate_column_report, run_basic_insights
+from auto_report_pipeline.report_generator import assemble_report, save_report
+from auto_report_pipeline.parallel import generate_column_report_parallel
+from auto_report_pipeline.profiling import DatasetProfile
+from auto_report_pipeline.section_cache import SectionCache
+from auto_report_pipeline.sinks import available_output_format
+from auto_report_pipeline.segments import (
+    SEGMENT_OUTPUTS,
+    generate_segmented_report,
+    segment_output_paths,
+)
+
+
+def read_preamble(config_path: str) -> dict[str, str]:
+    """Read the KEY,VALUE settings rows *before* the `COLUMN` header row.
+
+    Keys are lower-cased (e.g. "input", "output", "engine"); rows without a
+    value are ignored.
+    """
+    settings = {}
+    with open(config_path, newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        for row in reader:
+            if not row:
+                continue
+            key = (row[0] or "").strip().lower()
+            if key == "column":
+                break
+            if key and len(row) >= 2 and row[1].strip():
+                settings[key] = row[1].strip()
+    return settings
+
+
+def read_io_from_config(config_path: str) -> tuple[str | None, str | None]:
+    """Read INPUT and OUTPUT from the report_config CSV.
+
+    This scans lines *before* the header row that begins with `COLUMN` and
+    returns absolute paths resolved relative to the config file's directory.
+    """
+    cfg_dir = Path(config_path).resolve().parent
+    settings = read_preamble(config_path)
+    input_path = settings.get("input")
+    output_path = settings.get("output")
+
+    def _resolve(p: str | None) -> str | None:
+        if not p:
+            return None
+        pth = Path(p)
+        if not pth.is_absolute():
+            if (
+                cfg_dir.name == "csv_files"
+                and len(pth.parts) > 0
+                and pth.parts[0] == "csv_files"
+            ):
+                pth = Path(*pth.parts[1:]) if len(pth.parts) > 1 else Path(".")
+            pth = (cfg_dir / pth).resolve()
+        return str(pth)
+
+    return _resolve(input_path), _resolve(output_path)
+
+
+def resolve_engine(config_path: str | None = None, engine: str | None = None) -> str:
+    """CLI `--engine` wins, then the ENGINE row of the report_config, then "default"."""
+    if not engine and config_path:
+        try:
+            engine = read_preamble(config_path).get("engine")
+        except OSError:
+            engine = None
+    engine = (engine or "default").strip().lower()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    return engine
+
+
+def _safe_preamble(config_path: str | None) -> dict[str, str]:
+    if not config_path:
+        return {}
+    try:
+        return read_preamble(config_path)
+    except OSError:
+        return {}
+
+
+def _preamble_path(config_path: str | None, settings: dict, key: str) -> str | None:
+    """ Path-valued preamble setting, resolved against the config file's directory """
+    value = settings.get(key)
+    if value and config_path and not os.path.isabs(value):
+        value = str(Path(config_path).resolve().parent / value)
+    return value
+
+
+def resolve_profile_path(
+    config_path: str | None = None, profile_path: str | None = None
+) -> str | None:
+    """CLI `--profile-path` wins, then the PROFILE row of the report_config."""
+    return profile_path or _preamble_path(
+        config_path, _safe_preamble(config_path), "profile"
+    )
+
+
+def resolve_processes(
+    config_path: str | None = None, processes: int | None = None
+) -> int:
+    """CLI `--processes` wins, then the PROCESSES row of the report_config, then 1."""
+    if processes is None:
+        value = _safe_preamble(config_path).get("processes")
+        try:
+            processes = int(value) if value else 1
+        except ValueError:
+            print(f"[config] Ignoring invalid PROCESSES value: {value!r}")
+            processes = 1
+    return max(1, processes)
+
+
+def resolve_section_cache(
+    config_path: str | None = None, cache_dir: str | None = None
+) -> SectionCache | None:
+    """CLI `--section-cache` wins, then the SECTION_CACHE row of the report_config.
+
+    SECTION_CACHE_MB in the preamble caps the cache size (default 256 MB).
+    Relative directories are resolved against the config file's directory.
+    """
+    settings = _safe_preamble(config_path)
+    cache_dir = cache_dir or _preamble_path(config_path, settings, "section_cache")
+    if not cache_dir:
+        return None
+    try:
+        max_mb = float(settings.get("section_cache_mb", 256))
+    except ValueError:
+        max_mb = 256
+    return SectionCache(cache_dir, max_bytes=int(max_mb * 1024 * 1024))
+
+
+def resolve_segmenting(
+    config_path: str | None = None,
+    segment_by: str | None = None,
+    segment_output: str | None = None,
+) -> tuple[str | None, str]:
+    """CLI `--segment-by` / `--segment-output` win, then the SEGMENT BY and
+    SEGMENT_OUTPUT rows of the report_config.
+
+    SEGMENT_OUTPUT is "columns" (one report with per-segment columns, the
+    default) or "files" (one report per segment next to OUTPUT).
+    """
+    settings = _safe_preamble(config_path)
+    segment_by = segment_by or settings.get("segment by") or settings.get("segment_by")
+    segment_output = (
+        segment_output or settings.get("segment_output") or "columns"
+    ).strip().lower()
+    if segment_output not in SEGMENT_OUTPUTS:
+        print(f"[config] Ignoring invalid SEGMENT_OUTPUT value: {segment_output!r}")
+        segment_output = "columns"
+    return segment_by, segment_output
+
+
+def resolve_row_filter(
+    config_path: str | None = None,
+    required_columns: str | None = None,
+    filter_column: str | None = None,
+    filter_value: str | None = None,
+) -> RowFilter | None:
+    """CLI `--required-columns` / `--filter-column` / `--filter-value` win, then
+    the REQUIRED_COLUMNS, FILTER_COLUMN and FILTER_VALUE rows of the report_config.
+
+    REQUIRED_COLUMNS is a "|"-separated list. Returns None when nothing is set.
+    """
+    settings = _safe_preamble(config_path)
+    row_filter = RowFilter(
+        required_columns=parse_column_list(
+            required_columns or settings.get("required_columns")
+        ),
+        filter_column=filter_column or settings.get("filter_column"),
+        filter_value=filter_value or settings.get("filter_value"),
+    )
+    return row_filter or None
+
+
+def resolve_output_format(
+    config_path: str | None = None, output_format: str | None = None
+) -> str:
+    """CLI `--output-format` wins, then the OUTPUT_FORMAT row of the report_config,
+    then "csv".
+
+    One of csv, csv.gz, csv.zst, parquet, jsonl; it applies to the report and
+    the insights files. csv.zst needs `zstandard` and parquet needs `pyarrow`;
+    without them the nearest available format is used.
+    """
+    output_format = output_format or _safe_preamble(config_path).get("output_format")
+    try:
+        return available_output_format(output_format)
+    except ValueError as e:
+        print(f"[config] {e}; writing csv.")
+        return "csv"
+
+
+def make_unique_columns(cols) -> list:
+    """ Suffix repeated column names with .1, .2, ... so every column is addressable """
+    seen = {}
+    out = []
+    for c in cols:
+        name = str(c)
+        if name in seen:
+            seen[name] += 1
+            out.append(f"{name}.{seen[name]}")
+        else:
+            seen[name] = 0
+            out.append(name)
+    return out
+
+
+def load_input(
+    input_path: str, engine: str = "default", row_filter: RowFilter | None = None
+) -> pd.DataFrame:
+    """ Load the report input and de-duplicate its column names
+
+    With a `row_filter` the header is validated first and rows are filtered
+    chunk by chunk while reading; the counts end up in `df.attrs["load_stats"]`.
+    """
+    if row_filter:
+        df, stats = load_csv_filtered(input_path, row_filter, engine=engine)
+        print(f"[filter] Rows read: {stats['rows_read']}, kept: {stats['rows_kept']}")
+        df.attrs["load_stats"] = stats
+    else:
+        df = load_csv(input_path, engine=engine)
+    df = df.copy()
+    df.columns = make_unique_columns(df.columns)
+    return df
+
+
+def load_stats_blocks(df: pd.DataFrame) -> list:
+    """ Leading report block with the rows read/kept by a load-time RowFilter """
+    stats = df.attrs.get("load_stats")
+    if not stats:
+        return []
+    return [
+        [["Rows read", "", stats["rows_read"]], ["Rows kept", "", stats["rows_kept"]]]
+    ]
+
+
+def render_report(
+    df: pd.DataFrame,
+    config_df: pd.DataFrame,
+    output_path: str,
+    analytics: bool = True,
+    section_cache: SectionCache | None = None,
+    profiles: DatasetProfile | None = None,
+    profile_path: str | None = None,
+    processes: int = 1,
+    segment_by: str | None = None,
+    segment_output: str = "columns",
+    output_format: str = "csv",
+):
+    """
+    Generate, assemble and save the report for an already loaded input/config.
+
+    `profiles` is the DatasetProfile kept alongside `df`; it is shared by the
+    column report and the insights scan and, with `profile_path`, written out.
+    With `processes` > 1 the column report runs as a row-partitioned
+    map-reduce over a process pool.
+    With `segment_by` all segments are computed in one grouped pass and
+    written per `segment_output` ("columns" or "files"); the section cache
+    and process pool are not used for segmented runs.
+    `output_format` applies to the report and the insights files alike.
+    """
+    if profiles is None:
+        profiles = DatasetProfile(df)
+    if segment_by:
+        report_blocks, per_segment = generate_segmented_report(
+            df, config_df, segment_by
+        )
+    elif processes > 1:
+        report_blocks = generate_column_report_parallel(
+            df, config_df, processes=processes, section_cache=section_cache
+        )
+    else:
+        report_blocks = generate_column_report(
+            df, config_df, section_cache=section_cache, profiles=profiles
+        )
+    load_blocks = load_stats_blocks(df)
+    if segment_by and segment_output == "files":
+        paths = segment_output_paths(output_path, per_segment)
+        for segment, blocks in per_segment.items():
+            save_report(
+                assemble_report(load_blocks + blocks), paths[segment], output_format
+            )
+    else:
+        save_report(
+            assemble_report(load_blocks + report_blocks), output_path, output_format
+        )
+    if profile_path:
+        profiles.write_csv(profile_path)
+    if analytics:
+        try:
+            out_dir = os.path.dirname(output_path) or "."
+            run_basic_insights(
+                df,
+                config_df=config_df,
+                output_dir=out_dir,
+                profiles=profiles,
+                output_format=output_format,
+            )
+        except Exception as e:
+            print(f"[insights] Skipped due to error: {e}")
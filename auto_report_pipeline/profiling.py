@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_string_dtype,
+)
+
+
+@dataclass
+class ColumnProfile:
+    """ One-pass summary of a column used to pick code paths and prune work """
+
+    name: str
+    kind: str  # "numeric", "text", "boolean", "datetime" or "other"
+    rows: int
+    null_count: int
+    distinct_count: int
+    numeric_parseable: bool  # every non-null value parses as a number (optionally with %)
+    min: Optional[object] = None
+    max: Optional[object] = None
+    top_values: list = field(default_factory=list)  # [(value, count), ...]
+
+    @property
+    def non_null(self) -> int:
+        return self.rows - self.null_count
+
+    @property
+    def unique_ratio(self) -> float:
+        return self.distinct_count / self.non_null if self.non_null else 0.0
+
+    def is_categorical(self, max_unique_values: int = 20) -> bool:
+        return self.kind == "text" or self.distinct_count <= max_unique_values
+
+    def is_near_unique(self, max_unique_ratio: float = 0.95, min_distinct: int = 50) -> bool:
+        """ ID-like columns: almost every value distinct, so crosstabs are hopeless """
+        return self.distinct_count >= min_distinct and self.unique_ratio >= max_unique_ratio
+
+    def as_row(self) -> dict:
+        return {
+            "column": self.name,
+            "kind": self.kind,
+            "rows": self.rows,
+            "null_count": self.null_count,
+            "distinct_count": self.distinct_count,
+            "numeric_parseable": self.numeric_parseable,
+            "min": self.min,
+            "max": self.max,
+            "top_values": " | ".join(f"{v} ({c})" for v, c in self.top_values),
+        }
+
+
+def _kind(series: pd.Series) -> str:
+    dtype = series.dtype
+    if is_bool_dtype(dtype):
+        return "boolean"
+    if is_numeric_dtype(dtype):
+        return "numeric"
+    if is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if is_string_dtype(dtype):
+        return "text"
+    return "other"
+
+
+def profile_column(series: pd.Series, name: Optional[str] = None, top_k: int = 5) -> ColumnProfile:
+    """
+    Profile one column. A single value_counts pass provides the distinct
+    count and top-k values; parseability and min/max for text columns are
+    checked on the distinct values only.
+    """
+    kind = _kind(series)
+    rows = len(series)
+    counts = series.value_counts(dropna=True)
+    null_count = rows - int(counts.sum())
+
+    lo = hi = None
+    numeric_parseable = kind == "numeric" or (kind == "text" and not len(counts))
+    if kind == "numeric" and len(counts):
+        lo, hi = counts.index.min(), counts.index.max()
+    elif kind == "text" and len(counts):
+        distinct = pd.Series(counts.index.astype(str))
+        nums = pd.to_numeric(distinct.str.rstrip("%"), errors="coerce")
+        numeric_parseable = bool(nums.notna().all())
+        if numeric_parseable:
+            lo, hi = nums.min(), nums.max()
+        else:
+            lo, hi = distinct.min(), distinct.max()
+
+    top = counts.head(top_k)
+    return ColumnProfile(
+        name=str(name if name is not None else series.name),
+        kind=kind,
+        rows=rows,
+        null_count=null_count,
+        distinct_count=int(len(counts)),
+        numeric_parseable=numeric_parseable,
+        min=lo.item() if hasattr(lo, "item") else lo,
+        max=hi.item() if hasattr(hi, "item") else hi,
+        top_values=[(v, int(c)) for v, c in top.items()],
+    )
+
+
+class DatasetProfile:
+    """
+    Lazily computed, memoized column profiles for one loaded DataFrame.
+
+    Kept next to the input (single run, --watch, --serve) so the report and
+    the insights scan share one profiling pass per column.
+    """
+
+    def __init__(self, df: pd.DataFrame, top_k: int = 5):
+        self.df = df
+        self.top_k = top_k
+        self._profiles: dict[str, ColumnProfile] = {}
+
+    def __contains__(self, column) -> bool:
+        return column in self.df.columns
+
+    def __getitem__(self, column) -> ColumnProfile:
+        prof = self._profiles.get(column)
+        if prof is None:
+            prof = profile_column(self.df[column], name=column, top_k=self.top_k)
+            self._profiles[column] = prof
+        return prof
+
+    def get(self, column) -> Optional[ColumnProfile]:
+        return self[column] if column in self else None
+
+    def cached(self, column) -> Optional[ColumnProfile]:
+        """ The profile of `column` if it was already computed; never profiles """
+        return self._profiles.get(column)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([self[c].as_row() for c in self.df.columns])
+
+    def write_csv(self, path: str):
+        self.to_frame().to_csv(path, index=False)
+        print(f"✅ Column profile written → {path}")
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from auto_report_pipeline.sinks import output_path_for, write_table
+
 
 def assemble_report(sections: list) -> pd.DataFrame:
     """
@@ -11,6 +13,13 @@ def assemble_report(sections: list) -> pd.DataFrame:
     return pd.DataFrame(final_rows)
 
 
-def save_report(df: pd.DataFrame, output_path: str):
-    df.to_csv(output_path, index=False, header=False)
+def save_report(df: pd.DataFrame, output_path: str, output_format: str = "csv") -> str:
+    """
+    Write the assembled report in `output_format` (see sinks.OUTPUT_FORMATS);
+    other formats swap OUTPUT's extension. Returns the path written.
+    """
+    if output_format != "csv":
+        output_path = output_path_for(output_path, output_format)
+    write_table(df, output_path, output_format, header=False, typed=False)
     print(f"✅ Report saved to {output_path}")
+    return output_path
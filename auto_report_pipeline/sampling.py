@@ -0,0 +1,94 @@
+import math
+from statistics import NormalDist
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from auto_report_pipeline.crosstab import SparseCrosstab
+
+
+def sample_rows(total_rows: int, sample: float) -> int:
+    """ INSIGHTS_SAMPLE value -> row count: < 1 is a fraction, otherwise a row count """
+    if sample <= 0:
+        return total_rows
+    n = int(round(total_rows * sample)) if sample < 1 else int(sample)
+    return min(total_rows, max(n, 1))
+
+
+def draw_sample(
+    df: pd.DataFrame,
+    n: int,
+    seed: int = 0,
+    stratify: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Seeded random sample of `n` rows, kept in original row order.
+
+    With `stratify`, every value of that column (blank included) is sampled
+    at the same rate, so small groups keep their share of the sample.
+    """
+    if n >= len(df):
+        return df
+    if stratify and stratify in df.columns:
+        frac = n / len(df)
+        sample = df.groupby(stratify, dropna=False, group_keys=False, sort=False).sample(
+            frac=frac, random_state=seed
+        )
+    else:
+        sample = df.sample(n=n, random_state=seed)
+    return sample.sort_index()
+
+
+def _z(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def fisher_interval(r: float, n: int, confidence: float = 0.95) -> tuple[float, float]:
+    """ Analytic (Fisher z) confidence interval for a Pearson correlation """
+    if n <= 3 or not np.isfinite(r):
+        return -1.0, 1.0
+    z = math.atanh(min(max(r, -0.999999), 0.999999))
+    half = _z(confidence) / math.sqrt(n - 3)
+    return math.tanh(z - half), math.tanh(z + half)
+
+
+def strength_interval(lo: float, hi: float) -> tuple[float, float]:
+    """ Interval of |r| given an interval of r """
+    if lo <= 0 <= hi:
+        return 0.0, max(-lo, hi)
+    return min(abs(lo), abs(hi)), max(abs(lo), abs(hi))
+
+
+def bootstrap_cramers_v(
+    ctab: SparseCrosstab,
+    rounds: int = 200,
+    seed: int = 0,
+    confidence: float = 0.95,
+) -> tuple[float, float]:
+    """
+    Percentile bootstrap interval for Cramér's V.
+
+    Resampling rows with replacement is the same as drawing the cell counts
+    from a multinomial over the observed cells, so each round costs
+    O(non-zero cells) instead of O(rows).
+    """
+    total = ctab.total
+    if total <= 1:
+        return 0.0, 1.0
+    rng = np.random.default_rng(seed)
+    draws = rng.multinomial(total, ctab.counts / total, size=rounds)
+    values = np.array(
+        [
+            SparseCrosstab(
+                ctab.row_labels, ctab.col_labels, ctab.rows, ctab.cols, counts
+            ).cramers_v()
+            for counts in draws
+        ]
+    )
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return 0.0, 1.0
+    tail = (1 - confidence) / 2 * 100
+    lo, hi = np.percentile(values, [tail, 100 - tail])
+    return float(lo), float(hi)
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+# Bump when section computation changes so stale entries are never reused
+CACHE_VERSION = 5
+
+DIRECTIVE_FIELDS = [
+    "value",
+    "aggregate",
+    "root_only",
+    "delimiter",
+    "separate_nodes",
+    "duplicate",
+    "average",
+    "clean",
+]
+
+
+def _column_digest(column: pd.Series) -> bytes:
+    """ Content hash of a column's values (index ignored) and dtype """
+    h = hashlib.sha256(str(column.dtype).encode("utf-8"))
+    h.update(str(len(column)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(column, index=False).values.tobytes())
+    return h.digest()
+
+
+class SectionCache:
+    """
+    On-disk memo of report sections, one pickle file per section.
+
+    Keys combine the column's content hash with its normalized directive rows,
+    so editing one line of report_config only invalidates that column. The
+    directory is capped at `max_bytes`; least recently used files are evicted
+    first (hits refresh a file's mtime).
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, col_name: str, column: pd.Series, entries: pd.DataFrame) -> str:
+        fields = [f for f in DIRECTIVE_FIELDS if f in entries.columns]
+        directives = [
+            {f: str(v) for f, v in row.items()}
+            for row in entries[fields].to_dict("records")
+        ]
+        h = hashlib.sha256(f"v{CACHE_VERSION}:{col_name}".encode("utf-8"))
+        h.update(json.dumps(directives, sort_keys=True).encode("utf-8"))
+        h.update(_column_digest(column))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                section = pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return section
+
+    def put(self, key: str, section: list):
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(section, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        files = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".pkl"):
+                continue
+            st = entry.stat()
+            files.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def report(self):
+        print(
+            f"[cache] Sections: {self.hits} hit(s), {self.misses} miss(es), "
+            f"{self.evictions} evicted ({self.cache_dir})"
+        )
@@ -0,0 +1,261 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from auto_report_pipeline.sketch import NumericSummary
+from auto_report_pipeline.transform import (
+    _aggregate_text,
+    _clean_text,
+    _column_state,
+    _finalize_column_section,
+    _match_mask,
+    _matching_token_count,
+    _normalize_report_config,
+    _parse_numeric,
+    _resolve_report_columns,
+)
+from auto_report_pipeline.utils import _as_text, _norm_header, split_delimited_tokens
+
+SEGMENT_OUTPUTS = ("columns", "files")
+
+
+class Segments:
+    """
+    Factorized segment codes for one SEGMENT BY column.
+
+    `names` are the sorted distinct (stripped) values, blank cells forming a
+    "None" segment ("(blank)" if a literal "None" value exists too, so every
+    code keeps its own name); `groups[k]` holds the row positions of segment k
+    in row order, so any per-row array can be split by segment with one gather.
+    """
+
+    def __init__(self, column: pd.Series):
+        labels = _as_text(column).str.strip()
+        codes, uniques = pd.factorize(labels, sort=True)
+        self.codes = codes.astype(np.int64)
+        uniques = [str(u) for u in uniques]
+        blank = "(blank)" if "None" in uniques else "None"
+        self.names = [u or blank for u in uniques]
+        order = np.argsort(self.codes, kind="stable")
+        bounds = np.searchsorted(self.codes[order], np.arange(len(self.names) + 1))
+        self.groups = [order[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def sizes(self) -> list[int]:
+        return [len(g) for g in self.groups]
+
+    def bincount(self, mask: np.ndarray) -> list[int]:
+        """ Per-segment count of True cells """
+        return np.bincount(self.codes[mask], minlength=len(self)).tolist()
+
+    def value_counts(self, values: pd.Series) -> tuple[dict, list[dict]]:
+        """
+        Overall and per-segment value counts in first-appearance order (the
+        order of `value_counts(sort=False)`), from one pass over combined
+        segment x value codes.
+        """
+        value_codes, uniques = pd.factorize(values)
+        return self._pair_counts(self.codes, value_codes, uniques)
+
+    def token_counts(self, tokens: list, rows: np.ndarray) -> tuple[dict, list[dict]]:
+        """
+        Overall and per-segment counts of lower-cased tokens (the dicts
+        `count_delimited_tokens` returns) for tokens found at row positions
+        `rows`, counted like `value_counts` over segment x token codes.
+        """
+        codes, uniques = pd.factorize(np.asarray(tokens, dtype=object))
+        folded_codes, folded = pd.factorize(
+            np.asarray([u.lower() for u in uniques], dtype=object)
+        )
+        return self._pair_counts(self.codes[rows], folded_codes[codes], folded)
+
+    def _pair_counts(self, seg_codes, value_codes, uniques) -> tuple[dict, list[dict]]:
+        uniques = np.asarray(uniques, dtype=object)
+        n_values = max(len(uniques), 1)
+        overall = np.bincount(value_codes, minlength=len(uniques))
+        pair_codes, pairs = pd.factorize(seg_codes * n_values + value_codes)
+        pair_counts = np.bincount(pair_codes, minlength=len(pairs))
+        pair_seg, pair_value = np.divmod(np.asarray(pairs), n_values)
+        per_segment = []
+        for k in range(len(self)):
+            sel = pair_seg == k
+            per_segment.append(
+                dict(zip(uniques[pair_value[sel]].tolist(), pair_counts[sel].tolist()))
+            )
+        return dict(zip(uniques.tolist(), overall.tolist())), per_segment
+
+
+def _segment_states(column: pd.Series, entries: pd.DataFrame, segments: Segments):
+    """
+    (overall state, [state per segment]) for one configured column.
+
+    Same states as `_column_state` on the full column and on each segment's
+    rows, but every string transform runs once over the full column and only
+    its per-row result is split by segment.
+    """
+    n = len(segments)
+    if entries["clean"].any():
+        values = _clean_text(column).to_numpy(dtype=object)
+        return (
+            {"kind": "clean", "values": values.tolist()},
+            [{"kind": "clean", "values": values[g].tolist()} for g in segments.groups],
+        )
+
+    if entries["duplicate"].any():
+        overall, per_segment = segments.value_counts(_as_text(column))
+        return (
+            {"kind": "duplicate", "counts": overall},
+            [{"kind": "duplicate", "counts": c} for c in per_segment],
+        )
+
+    if entries["average"].any():
+        values, non_numeric, percent = _parse_numeric(column)
+        overall = NumericSummary().update(values, non_numeric.sum(), percent.any())
+        states = []
+        for g in segments.groups:
+            summary = NumericSummary().update(
+                values[g], non_numeric[g].sum(), percent[g].any()
+            )
+            states.append({"kind": "average", "summary": summary})
+        return {"kind": "average", "summary": overall}, states
+
+    overall = []
+    parts = [[] for _ in range(n)]
+    search_value = entries[entries["value"] != ""]
+    rows = search_value if not search_value.empty else entries
+    text = _as_text(column)
+    token_counts = {}  # delimiter -> (overall, per segment): tokenize once
+    for _, r in rows.iterrows():
+        if r["separate_nodes"]:
+            if r["delimiter"] not in token_counts:
+                token_counts[r["delimiter"]] = segments.token_counts(
+                    *split_delimited_tokens(text, r["delimiter"])
+                )
+            tokens, seg_tokens = token_counts[r["delimiter"]]
+            if not search_value.empty:
+                label = r["value"] or "None"
+                overall.append(["set", label, _matching_token_count(tokens, r["value"])])
+                for k in range(n):
+                    cnt = _matching_token_count(seg_tokens[k], r["value"])
+                    parts[k].append(["set", label, cnt])
+            else:
+                overall.append(["tokens", tokens])
+                for k in range(n):
+                    parts[k].append(["tokens", seg_tokens[k]])
+        elif search_value.empty and r["aggregate"]:
+            counts, seg_counts = segments.value_counts(_aggregate_text(column, r))
+            overall.append(["aggregate", counts])
+            for k in range(n):
+                parts[k].append(["aggregate", seg_counts[k]])
+        else:
+            op = "set" if not search_value.empty else "add"
+            mask = _match_mask(column, r)
+            overall.append([op, r["value"] or "None", int(mask.sum())])
+            for k, cnt in enumerate(segments.bincount(mask)):
+                parts[k].append([op, r["value"] or "None", cnt])
+    return (
+        {"kind": "counts", "parts": overall},
+        [{"kind": "counts", "parts": p} for p in parts],
+    )
+
+
+def _widen_section(section: list, seg_sections: list, seg_states: list, names: list) -> list:
+    """ Add per-segment columns to an overall section (matched by row label) """
+    header = section[0]
+    if header[2] == "Cleaned":
+        return section
+    if header[2] == "Count":
+        wide = [header + [f"{name} {h}" for name in names for h in ("%", "Count")]]
+        lookup = [{row[0]: row[1:] for row in s[1:]} for s in seg_sections]
+        for row in section[1:]:
+            extra = []
+            for seg in lookup:
+                extra.extend(seg.get(row[0], ["0.00%", 0]))
+            wide.append(row + extra)
+        return wide
+    if header[2] == "Instances":
+        wide = [header + names]
+        for row in section[1:]:
+            wide.append(row + [st["counts"].get(row[1], 0) for st in seg_states])
+        return wide
+    # Average
+    wide = [header + names]
+    lookup = [{row[0]: row[2] for row in s[1:]} for s in seg_sections]
+    for row in section[1:]:
+        wide.append(row + [seg.get(row[0], "") for seg in lookup])
+    return wide
+
+
+def generate_segmented_report(
+    report_df: pd.DataFrame,
+    config_df: pd.DataFrame,
+    segment_by: str,
+) -> tuple[list, dict[str, list]]:
+    """
+    Column report for every segment of `segment_by` in one grouped pass.
+
+    Returns (combined sections, {segment: sections}). Combined sections are
+    the usual report with "<segment> %" / "<segment> Count" columns (or one
+    value column per segment for DUPLICATE/AVERAGE) appended; per-segment
+    sections are exactly what a run over that segment's rows alone produces.
+    """
+    header_lookup = {_norm_header(c): c for c in report_df.columns}
+    segment_col = header_lookup.get(_norm_header(segment_by))
+    if segment_col is None:
+        raise KeyError(f"SEGMENT BY column {segment_by!r} not found in input")
+
+    segments = Segments(report_df[segment_col])
+    names, sizes = segments.names, segments.sizes
+    total_rows = len(report_df)
+    cfg = _normalize_report_config(config_df)
+
+    combined = [[["Total rows", "", total_rows] + sizes]]
+    per_segment = {name: [[["Total rows", "", size]]] for name, size in zip(names, sizes)}
+    for col_name, resolved_col, entries in _resolve_report_columns(report_df, cfg):
+        column = report_df[resolved_col]
+        if not len(segments):
+            combined.append(
+                _finalize_column_section(col_name, _column_state(column, entries), 0)
+            )
+            continue
+        overall, seg_states = _segment_states(column, entries, segments)
+        section = _finalize_column_section(col_name, overall, total_rows)
+        seg_sections = [
+            _finalize_column_section(col_name, st, size)
+            for st, size in zip(seg_states, sizes)
+        ]
+        combined.append(_widen_section(section, seg_sections, seg_states, names))
+        for name, seg_section in zip(names, seg_sections):
+            per_segment[name].append(seg_section)
+    print(f"[segment] {len(names)} segment(s) of {segment_col!r} in one pass")
+    return combined, per_segment
+
+
+def segment_output_path(output_path: str, segment: str) -> str:
+    """ report.csv -> report_<segment>.csv (segment name made filename-safe) """
+    stem, ext = os.path.splitext(output_path)
+    safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in segment)
+    return f"{stem}_{safe or 'None'}{ext or '.csv'}"
+
+
+def segment_output_paths(output_path: str, segments) -> dict[str, str]:
+    """
+    {segment: file} for every segment, like `segment_output_path` but with a
+    _2, _3, ... suffix when two names sanitize to the same file ("a/b" and
+    "a_b"; compared case-insensitively for case-insensitive filesystems).
+    """
+    paths, taken = {}, set()
+    for segment in segments:
+        path = segment_output_path(output_path, segment)
+        stem, ext = os.path.splitext(path)
+        n = 1
+        while path.casefold() in taken:
+            n += 1
+            path = f"{stem}_{n}{ext}"
+        taken.add(path.casefold())
+        paths[segment] = path
+    return paths
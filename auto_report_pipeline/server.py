@@ -0,0 +1,274 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import pandas as pd
+
+from auto_report_pipeline.extract import RowFilter, load_csv
+from auto_report_pipeline.pipeline import (
+    load_input,
+    load_stats_blocks,
+    read_io_from_config,
+    resolve_engine,
+    resolve_row_filter,
+    resolve_segmenting,
+)
+from auto_report_pipeline.profiling import DatasetProfile
+from auto_report_pipeline.transform import generate_column_report
+from auto_report_pipeline.report_generator import assemble_report
+
+
+def _file_key(path: str) -> tuple:
+    """ Identity of a file on disk: resolved path plus (mtime_ns, size) """
+    resolved = os.path.realpath(path)
+    st = os.stat(resolved)
+    return (resolved, st.st_mtime_ns, st.st_size)
+
+
+def _frame_nbytes(df: pd.DataFrame) -> int:
+    try:
+        return int(df.memory_usage(deep=True).sum())
+    except Exception:
+        return 0
+
+
+class DatasetCache:
+    """
+    LRU cache of parsed input DataFrames (each with its DatasetProfile)
+    bounded by a memory budget (bytes).
+
+    Entries are keyed by path + mtime + size (+ engine, row filter), so an edited file is re-parsed
+    on its next request. Concurrent misses for the same file share one load.
+    A single frame larger than the budget is still returned, just not kept.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, tuple[pd.DataFrame, DatasetProfile, int]]" = (
+            OrderedDict()
+        )
+        self._loading: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, path: str, engine: str = "default", row_filter: Optional[RowFilter] = None
+    ) -> pd.DataFrame:
+        return self.load(path, engine, row_filter)[0]
+
+    def load(
+        self, path: str, engine: str = "default", row_filter: Optional[RowFilter] = None
+    ) -> tuple[pd.DataFrame, DatasetProfile]:
+        key = _file_key(path) + (engine, row_filter)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[1]
+            pending = self._loading.get(key)
+            owner = pending is None
+            if owner:
+                self.misses += 1
+                pending = Future()
+                self._loading[key] = pending
+        if not owner:
+            return pending.result()
+
+        try:
+            df = load_input(path, engine=engine, row_filter=row_filter)
+        except BaseException as e:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.set_exception(e)
+            raise
+        loaded = (df, DatasetProfile(df))
+        self._store(key, *loaded)
+        pending.set_result(loaded)
+        return loaded
+
+    def _store(self, key: tuple, df: pd.DataFrame, profile: DatasetProfile):
+        size = _frame_nbytes(df)
+        with self._lock:
+            self._loading.pop(key, None)
+            # Older versions of the same file can never be hit again
+            for stale in [
+                k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]
+            ]:
+                self.nbytes -= self._entries.pop(stale)[2]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (df, profile, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and self._entries:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class ReportService:
+    """
+    Runs report requests on a worker pool against a shared DatasetCache.
+
+    Identical concurrent requests (same input file state + same config bytes)
+    are coalesced: the first one computes, the rest wait on the same Future.
+    """
+
+    def __init__(self, max_workers: int = 4, cache_bytes: int = 512 * 1024 * 1024):
+        self.cache = DatasetCache(cache_bytes)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="report"
+        )
+        self._inflight: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.coalesced = 0
+
+    def _request_key(self, input_path: str, config_path: str) -> tuple:
+        with open(config_path, "rb") as fh:
+            config_hash = hashlib.sha256(fh.read()).hexdigest()
+        return (_file_key(input_path), config_hash)
+
+    def submit(self, config_path: str, input_path: Optional[str] = None) -> Future:
+        """ Queue a report; returns a Future resolving to the report CSV text """
+        if not input_path:
+            input_path, _ = read_io_from_config(config_path)
+        if not input_path:
+            raise ValueError("INPUT path not provided and not found in report_config.")
+        key = self._request_key(input_path, config_path)
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.coalesced += 1
+                return fut
+            fut = self._pool.submit(self._compute, input_path, config_path)
+            self._inflight[key] = fut
+        fut.add_done_callback(lambda _f, k=key: self._forget(k))
+        return fut
+
+    def _forget(self, key: tuple):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def _compute(self, input_path: str, config_path: str) -> str:
+        df, profiles = self.cache.load(
+            input_path, resolve_engine(config_path), resolve_row_filter(config_path)
+        )
+        config_df = load_csv(config_path)
+        segment_by, _ = resolve_segmenting(config_path)
+        report = assemble_report(
+            load_stats_blocks(df)
+            + generate_column_report(
+                df, config_df, profiles=profiles, segment_by=segment_by
+            )
+        )
+        with self._lock:
+            self.computed += 1
+        return report.to_csv(index=False, header=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = {"computed": self.computed, "coalesced": self.coalesced}
+        out["cache"] = self.cache.stats()
+        return out
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+
+class _ReportHandler(BaseHTTPRequestHandler):
+    """
+    POST /report  {"config_path": "...", "input_path": "..." (optional)}
+        -> 200 text/csv report
+    GET  /stats   -> 200 application/json cache / coalescing counters
+    """
+
+    service: ReportService = None
+
+    def _send(self, status: int, body: str, content_type: str):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status: int, payload: dict):
+        self._send(status, json.dumps(payload), "application/json")
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.service.stats())
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/report":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            config_path = payload.get("config_path")
+            if not config_path:
+                raise ValueError("config_path is required")
+            fut = self.service.submit(config_path, payload.get("input_path"))
+        except (ValueError, OSError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            csv_text = fut.result()
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send(200, csv_text, "text/csv")
+
+    def log_message(self, format, *args):
+        print(f"[server] {self.address_string()} {format % args}")
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    max_workers: int = 4,
+    cache_bytes: int = 512 * 1024 * 1024,
+) -> ThreadingHTTPServer:
+    """ Build (but do not start) the HTTP server; `server.service` holds the ReportService """
+    service = ReportService(max_workers=max_workers, cache_bytes=cache_bytes)
+    handler = type("ReportHandler", (_ReportHandler,), {"service": service})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.service = service
+    return httpd
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    max_workers: int = 4,
+    cache_bytes: int = 512 * 1024 * 1024,
+):
+    httpd = make_server(host, port, max_workers=max_workers, cache_bytes=cache_bytes)
+    print(f"[server] Listening on http://{host}:{httpd.server_address[1]} (POST /report)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("[server] Stopped.")
+    finally:
+        httpd.server_close()
+        httpd.service.shutdown()
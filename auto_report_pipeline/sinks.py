@@ -0,0 +1,164 @@
+import gzip
+import io
+from typing import Optional
+
+import pandas as pd
+
+OUTPUT_FORMATS = ("csv", "csv.gz", "csv.zst", "parquet", "jsonl")
+# Formats written as one table (appended piece by piece) instead of CSV blocks
+COLUMNAR_FORMATS = ("parquet", "jsonl")
+
+_EXTENSIONS = {
+    "csv": ".csv",
+    "csv.gz": ".csv.gz",
+    "csv.zst": ".csv.zst",
+    "parquet": ".parquet",
+    "jsonl": ".jsonl",
+}
+_BUFFER = 1 << 20
+
+
+def available_output_format(fmt: Optional[str]) -> str:
+    """
+    Validate an output format and fall back when its optional dependency is
+    missing: csv.zst needs `zstandard` (falls back to csv.gz),
+    parquet needs `pyarrow` (falls back to csv).
+    """
+    fmt = (fmt or "csv").strip().lower()
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {fmt!r}; expected one of {OUTPUT_FORMATS}")
+    if fmt == "csv.zst":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            print("[output] zstandard not installed; writing csv.gz instead.")
+            return "csv.gz"
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("[output] pyarrow not installed; writing csv instead.")
+            return "csv"
+    return fmt
+
+
+def output_path_for(path: str, fmt: str) -> str:
+    """ report.csv -> report.csv.gz / report.parquet / ... for `fmt` """
+    lowered = path.lower()
+    for ext in sorted(_EXTENSIONS.values(), key=len, reverse=True):
+        if lowered.endswith(ext):
+            path = path[: -len(ext)]
+            break
+    return path + _EXTENSIONS[fmt]
+
+
+def open_csv_sink(path: str, fmt: str = "csv"):
+    """ Buffered text handle for the CSV formats, compressed on the fly """
+    if fmt == "csv":
+        return open(path, mode="w", newline="", encoding="utf-8", buffering=_BUFFER)
+    if fmt == "csv.gz":
+        # mtime=0 like write_table, so identical content gives identical files
+        raw = gzip.GzipFile(path, mode="wb", compresslevel=6, mtime=0)
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    if fmt == "csv.zst":
+        import zstandard
+
+        return zstandard.open(path, mode="wt", newline="", encoding="utf-8")
+    raise ValueError(f"{fmt!r} is not a CSV output format")
+
+
+class TableSink:
+    """
+    Appends DataFrames with the same `columns` to one Parquet (a row group
+    per append, via ParquetWriter) or JSON Lines file as they are produced,
+    so only the current piece is held in memory. A sink closed without any
+    append still writes an empty table with those columns.
+    """
+
+    def __init__(self, path: str, fmt: str, columns: list):
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"{fmt!r} is not a columnar output format")
+        self.path = path
+        self.fmt = fmt
+        self.columns = list(columns)
+        self.rows = 0
+        self._writer = None
+        self._fh = None
+
+    def __enter__(self) -> "TableSink":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, df: pd.DataFrame):
+        df = df[self.columns]
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._writer is None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                table = pa.Table.from_pandas(
+                    df, schema=self._writer.schema, preserve_index=False
+                )
+            self._writer.write_table(table)
+        else:
+            if self._fh is None:
+                self._fh = open(self.path, mode="w", encoding="utf-8", buffering=_BUFFER)
+            df.to_json(self._fh, orient="records", lines=True, force_ascii=False)
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is None and self._fh is None:
+            write_table(pd.DataFrame(columns=self.columns), self.path, self.fmt)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _as_text_table(df: pd.DataFrame, header: bool) -> pd.DataFrame:
+    """ String cells (blank for missing) and string column names, for typed sinks """
+    out = df.astype(object).where(df.notna(), "").astype(str)
+    if not header:
+        out.columns = [f"c{i}" for i in range(out.shape[1])]
+    else:
+        out.columns = [str(c) for c in out.columns]
+    return out
+
+
+def write_table(
+    df: pd.DataFrame,
+    path: str,
+    fmt: str = "csv",
+    header: bool = True,
+    typed: bool = True,
+):
+    """
+    Write a whole DataFrame in one call in `fmt`.
+
+    CSV variants match `df.to_csv(index=False)`. With `typed=False` (mixed
+    report grids) Parquet/JSONL cells are written as strings, and a
+    headerless frame gets c0..cN column names.
+    """
+    if fmt in ("csv", "csv.gz", "csv.zst"):
+        compression = {
+            "csv": None,
+            "csv.gz": {"method": "gzip", "compresslevel": 6, "mtime": 0},
+            "csv.zst": {"method": "zstd"},
+        }[fmt]
+        df.to_csv(path, index=False, header=header, compression=compression)
+        return
+    if not typed or not header:
+        df = _as_text_table(df, header)
+    if fmt == "parquet":
+        df.to_parquet(path, index=False)
+    elif fmt == "jsonl":
+        df.to_json(path, orient="records", lines=True, force_ascii=False)
+    else:
+        raise ValueError(f"Unknown output format {fmt!r}; expected one of {OUTPUT_FORMATS}")
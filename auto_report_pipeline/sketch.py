@@ -0,0 +1,139 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+
+class TDigest:
+    """
+    Mergeable quantile sketch (merging t-digest, k1 scale function).
+
+    Values are kept exactly until `exact_limit` is exceeded (never, with
+    None), so small columns get exact percentiles; beyond that they are
+    compressed into at most ~`compression` centroids that are narrow in the
+    tails (good p90/p99) and wide in the middle. Compression is vectorized:
+    sort, map cumulative weight through the scale function and sum each
+    integer k-bucket.
+
+    While exact, every weight is 1 and `means` holds the raw values; once
+    compressed, `means` is sorted. Compressed results depend slightly on how
+    the input was split and merged; exact digests give the same answer for
+    every partitioning.
+    """
+
+    def __init__(self, compression: int = 200, exact_limit: Optional[int] = 50_000):
+        self.compression = compression
+        self.exact_limit = exact_limit
+        self.means = np.empty(0, dtype=float)
+        self.weights = np.empty(0, dtype=float)
+        self.exact = True
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray) -> "TDigest":
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if values.size:
+            self._absorb(values, np.ones(values.size), exact=True)
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """ Merge `other` into this digest (in place) and return self """
+        if other.weights.size:
+            self._absorb(other.means, other.weights, exact=other.exact)
+        return self
+
+    def _absorb(self, means: np.ndarray, weights: np.ndarray, exact: bool):
+        self.means = np.concatenate([self.means, means])
+        self.weights = np.concatenate([self.weights, weights])
+        self.exact = self.exact and exact
+        if not self.exact or (
+            self.exact_limit is not None and self.means.size > self.exact_limit
+        ):
+            self._compress()
+
+    def _compress(self):
+        order = np.argsort(self.means, kind="stable")
+        means = self.means[order]
+        weights = self.weights[order]
+        total = weights.sum()
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression * (np.arcsin(2 * q - 1) / math.pi + 0.5)
+        bucket = np.floor(k).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        w = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / w
+        self.weights = w
+        self.exact = False
+
+    def quantile(self, q: float) -> float:
+        if not self.weights.size:
+            return float("nan")
+        if self.exact:
+            # Same definition as numpy/pandas "linear" quantiles
+            return float(np.quantile(self.means, q))
+        if self.means.size == 1:
+            return float(self.means[0])
+        centers = (np.cumsum(self.weights) - self.weights / 2) / self.weights.sum()
+        return float(np.interp(q, centers, self.means))
+
+
+class NumericSummary:
+    """
+    Streaming, mergeable numeric summary: count, mean and stddev (Chan's
+    parallel update), min/max, a TDigest for percentiles, the number of
+    non-numeric cells and whether any cell carried a "%" suffix.
+
+    Memory is bounded by the digest: percentiles are exact up to its
+    `exact_limit` values and approximate beyond.
+    """
+
+    def __init__(self, digest: Optional[TDigest] = None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.non_numeric = 0
+        self.percent = False
+        self.digest = digest or TDigest()
+
+    def update(self, values: np.ndarray, non_numeric: int = 0, percent: bool = False):
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        other = NumericSummary(TDigest(self.digest.compression, self.digest.exact_limit))
+        other.non_numeric = int(non_numeric)
+        other.percent = bool(percent)
+        if values.size:
+            other.count = int(values.size)
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min = float(values.min())
+            other.max = float(values.max())
+            other.digest.update(values)
+        return self.merge(other)
+
+    def merge(self, other: "NumericSummary") -> "NumericSummary":
+        """ Merge `other` into this summary (in place) and return self """
+        if other.count:
+            n = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / n
+            self.m2 += other.m2 + delta * delta * self.count * other.count / n
+            self.count = n
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self.digest.merge(other.digest)
+        self.non_numeric += other.non_numeric
+        self.percent = self.percent or other.percent
+        return self
+
+    @property
+    def std(self) -> float:
+        """ Sample standard deviation (ddof=1), like pandas Series.std """
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else float("nan")
+
+    def quantile(self, q: float) -> float:
+        return self.digest.quantile(q)
@@ -1,8 +1,43 @@
 import pandas as pd
 import re
-from auto_report_pipeline.utils import clean_list_string
+from auto_report_pipeline.utils import (
+    _as_text,
+    _norm_header,
+    clean_list_string,
+    count_delimited_tokens,
+)
+# Load-time schema check and row filter live with the loaders; re-exported here
+from auto_report_pipeline.extract import missing_columns, transform_data, validate_schema
+from auto_report_pipeline.sketch import NumericSummary
+from auto_report_pipeline.crosstab import CROSSTAB_FORMATS, LONG_HEADER, sparse_crosstab
+from auto_report_pipeline.sampling import (
+    bootstrap_cramers_v,
+    draw_sample,
+    fisher_interval,
+    sample_rows,
+    strength_interval,
+)
+from auto_report_pipeline.sinks import (
+    COLUMNAR_FORMATS,
+    TableSink,
+    open_csv_sink,
+    output_path_for,
+    write_table,
+)
 import numpy as np
 import csv
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from typing import Optional
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """Vectorized equivalent of `series.apply(clean_list_string)`."""
+    return (
+        _as_text(series)
+        .str.replace(r"[^a-zA-Z0-9, ]+", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
 
 
 # Helper for "root_only" delimiter splitting
@@ -13,13 +48,13 @@ def _apply_root_only(series: pd.Series, delimiter: str) -> pd.Series:
     if delimiter is None or str(delimiter) == "":
         return series
     delim = str(delimiter)
-    # Build a regex that splits on first occurrence of the delimiter
+    # Drop everything from the first occurrence of the delimiter onwards
     if delim == ".":
-        pattern = r"\s*\.\s*"
+        pattern = r"\s*\.\s*[\s\S]*$"
     else:
-        pattern = rf"\s*{re.escape(delim)}\s*"
+        pattern = rf"\s*{re.escape(delim)}\s*[\s\S]*$"
     try:
-        return series.astype(str).str.split(pattern, n=1, regex=True).str[0].str.strip()
+        return _as_text(series).str.replace(pattern, "", regex=True).str.strip()
     except Exception:
         return series
 
@@ -54,9 +89,18 @@ To clean any marking from a string, this is to only output character
 """
 
 
-def generate_column_report(report_df: pd.DataFrame, config_df: pd.DataFrame) -> list:
-    total_config = len(config_df)
-    total_rows = len(report_df)
+REPORT_FLAGS = [
+    "aggregate",
+    "root_only",
+    "separate_nodes",
+    "duplicate",
+    "average",
+    "clean",
+]
+
+
+def _normalize_report_config(config_df: pd.DataFrame) -> pd.DataFrame:
+    """ Normalize column names, flags, VALUE and DELIMITER of report_config rows """
     cfg = config_df.copy()
     cfg.columns = cfg.columns.str.strip().str.lower().str.replace(" ", "_")
     cfg["column"] = cfg["column"].astype(str).str.strip()
@@ -69,23 +113,7 @@ def generate_column_report(report_df: pd.DataFrame, config_df: pd.DataFrame) ->
         .str.strip()
     )
 
-    def _norm_header(s: str) -> str:
-        s = str(s).strip()
-        s = re.sub(r"^[\"']+|[\"']+$", "", s)
-        s = re.sub(r"\s+", " ", s)
-        return s.lower().replace(" ", "_")
-
-    header_lookup = {_norm_header(c): c for c in report_df.columns}
-
-    flags = [
-        "aggregate",
-        "root_only",
-        "separate_nodes",
-        "duplicate",
-        "average",
-        "clean",
-    ]
-    for flag in flags:
+    for flag in REPORT_FLAGS:
         if flag in cfg.columns:
             cfg[flag] = (
                 cfg[flag]
@@ -96,7 +124,7 @@ def generate_column_report(report_df: pd.DataFrame, config_df: pd.DataFrame) ->
                 .isin(["yes", "true"])
             )
         else:
-            cfg[flag] = "False"
+            cfg[flag] = False
 
     if "value" in cfg.columns:
         cfg["value"] = cfg["value"].fillna("").astype(str).str.lower()
@@ -107,120 +135,271 @@ def generate_column_report(report_df: pd.DataFrame, config_df: pd.DataFrame) ->
         cfg["delimiter"] = cfg["delimiter"].fillna("|").astype(str)
     else:
         cfg["delimiter"] = ""
+    return cfg
+
+
+def _parse_numeric(column: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Per-cell (float value, non-numeric flag, "%"-suffix flag) for AVERAGE """
+    dtype = column.dtype
+    if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+        values = column.to_numpy(dtype=float, na_value=np.nan)
+        flags = np.zeros(len(values), dtype=bool)
+        return values, flags, flags
+    raw = _as_text(column).str.strip()
+    nums = pd.to_numeric(raw.str.rstrip("%"), errors="coerce")
+    values = nums.to_numpy(dtype=float, na_value=np.nan)
+    non_numeric = (raw != "").to_numpy(dtype=bool) & ~np.isfinite(values)
+    percent = raw.str.endswith("%").to_numpy(dtype=bool)
+    return values, non_numeric, percent
+
+
+def _match_mask(column: pd.Series, r) -> np.ndarray:
+    """ Cells whose (root) value list contains the directive's VALUE """
+    series = _as_text(column)
+    if r["root_only"]:
+        series = _apply_root_only(series, r["delimiter"])
+    pattern = rf"(?:^|\|)\s*{re.escape(r["value"])}\s*(?:\||$)"
+    return series.str.lower().str.contains(pattern).to_numpy(dtype=bool)
+
+
+def _matching_token_count(tokens: dict, value: str) -> int:
+    return sum(c for tok, c in tokens.items() if clean_list_string(tok) == value)
+
+
+def _aggregate_text(column: pd.Series, r) -> pd.Series:
+    """ Normalized cell values counted by an AGGREGATE directive """
+    series = _as_text(column)
+    if r["root_only"]:
+        series = _apply_root_only(series, r["delimiter"])
+    return series.str.strip().str.lower()
+
+
+def _column_state(
+    column: pd.Series,
+    entries: pd.DataFrame,
+    profile=None,
+) -> dict:
+    """
+    Partial (mergeable) state of one configured column over a block of rows.
+
+    Column sections are computed as state -> merge -> finalize so the same
+    code serves a single pass and row-partitioned runs:
+      clean      ordered cleaned rows
+      duplicate  value counts in first-appearance order
+      average    NumericSummary (moments, min/max, t-digest, non-numeric count)
+      counts     one partial per directive row (match counts, token counts,
+                 aggregate value counts) replayed in directive order
+    An optional ColumnProfile lets DUPLICATE skip the scan of an all-distinct
+    column.
+    """
+    if entries["clean"].any():
+        return {"kind": "clean", "values": _clean_text(column).tolist()}
+
+    if entries["duplicate"].any():
+        if (
+            profile is not None
+            and profile.null_count == 0
+            and profile.distinct_count == profile.rows
+            and profile.kind in ("numeric", "text")
+        ):
+            return {"kind": "duplicate", "counts": {}}
+        counts = _as_text(column).value_counts(sort=False)
+        return {"kind": "duplicate", "counts": dict(zip(counts.index, counts.tolist()))}
+
+    if entries["average"].any():
+        values, non_numeric, percent = _parse_numeric(column)
+        summary = NumericSummary().update(values, non_numeric.sum(), percent.any())
+        return {"kind": "average", "summary": summary}
+
+    parts = []
+    search_value = entries[entries["value"] != ""]
+    if not search_value.empty:
+        for _, r in search_value.iterrows():
+            if r["separate_nodes"]:
+                tokens = count_delimited_tokens(_as_text(column), r["delimiter"])
+                cnt = _matching_token_count(tokens, r["value"])
+            else:
+                cnt = int(_match_mask(column, r).sum())
+            parts.append(["set", r["value"] or "None", cnt])
+    else:
+        for _, r in entries.iterrows():
+            if r["separate_nodes"]:
+                tokens = count_delimited_tokens(_as_text(column), r["delimiter"])
+                parts.append(["tokens", tokens])
+            elif r["aggregate"]:
+                counts = _aggregate_text(column, r).value_counts(sort=False)
+                parts.append(["aggregate", dict(zip(counts.index, counts.tolist()))])
+            else:
+                cnt = int(_match_mask(column, r).sum())
+                parts.append(["add", r["value"] or "None", cnt])
+    return {"kind": "counts", "parts": parts}
 
-    sections = []
-    sections.append([["Total rows", "", total_rows]])
 
+def _merge_counts(a: dict, b: dict) -> dict:
+    """ Sum two ordered count dicts; keys keep their first-appearance order """
+    out = dict(a)
+    for key, cnt in b.items():
+        out[key] = out.get(key, 0) + cnt
+    return out
+
+
+def _merge_column_states(a: dict, b: dict) -> dict:
+    """ Combine the states of two consecutive row blocks (`a` before `b`) """
+    kind = a["kind"]
+    if kind == "clean":
+        return {"kind": kind, "values": a["values"] + b["values"]}
+    if kind == "duplicate":
+        return {"kind": kind, "counts": _merge_counts(a["counts"], b["counts"])}
+    if kind == "average":
+        return {"kind": kind, "summary": a["summary"].merge(b["summary"])}
+    parts = []
+    for pa, pb in zip(a["parts"], b["parts"]):
+        if pa[0] in ("set", "add"):
+            parts.append([pa[0], pa[1], pa[2] + pb[2]])
+        else:
+            parts.append([pa[0], _merge_counts(pa[1], pb[1])])
+    return {"kind": kind, "parts": parts}
+
+
+def _finalize_column_section(col_name: str, state: dict, total_rows: int) -> list:
+    """ Turn a (fully merged) column state into report section rows """
+    title = col_name.replace("_", " ").upper()
+    kind = state["kind"]
+
+    if kind == "clean":
+        clean_section = [[title, "", "Cleaned"]]
+        for val in state["values"]:
+            clean_section.append(["", "", val])
+        return clean_section
+
+    if kind == "duplicate":
+        section = [[title, "Duplicates", "Instances"]]
+        if state["counts"]:
+            # Same ordering as Series.value_counts(): first appearance, then by count
+            counts = pd.Series(state["counts"], dtype="int64").sort_values(
+                ascending=False, kind="stable"
+            )
+            for value, cnt in counts[counts > 1].items():
+                section.append(["", value, cnt])
+        return section
+
+    if kind == "average":
+        summary = state["summary"]
+        section = [[title, "", "Average"]]
+        if not summary.count:
+            section.append(["Non-digit field", "", ""])
+        else:
+            unit = "%" if summary.percent else ""
+            for label, val in [
+                ("Mean", summary.mean),
+                ("Median", summary.quantile(0.5)),
+                ("P90", summary.quantile(0.9)),
+                ("P99", summary.quantile(0.99)),
+                ("Std dev", summary.std),
+                ("Min", summary.min),
+                ("Max", summary.max),
+            ]:
+                section.append([label, "", f"{val:.2f}{unit}"])
+            section.append(["Count", "", summary.count])
+        section.append(["Non-numeric", "", summary.non_numeric])
+        return section
+
+    label_counts = {}
+    for part in state["parts"]:
+        if part[0] == "set":
+            label_counts[part[1]] = part[2]
+        elif part[0] == "add":
+            label_counts[part[1]] = label_counts.get(part[1], 0) + part[2]
+        elif part[0] == "tokens":
+            for val, cnt in part[1].items():
+                label = val or "None"
+                label_counts[label] = label_counts.get(label, 0) + cnt
+        else:
+            counts = part[1]
+            for val in sorted(counts):
+                if not val.strip():
+                    continue
+                label_counts[val] = counts[val]
+
+    section = [[title, "%", "Count"]]
+    for label, cnt in label_counts.items():
+        pct = round(cnt / total_rows * 100, 2)
+        section.append([label, f"{pct:.2f}%", cnt])
+    return section
+
+
+def _column_section(
+    col_name: str,
+    column: pd.Series,
+    entries: pd.DataFrame,
+    total_rows: int,
+    profile=None,
+) -> list:
+    """ Build the report section for one configured column from its directive rows """
+    state = _column_state(column, entries, profile)
+    return _finalize_column_section(col_name, state, total_rows)
+
+
+def _resolve_report_columns(report_df: pd.DataFrame, cfg: pd.DataFrame) -> list:
+    """ [(config column name, resolved DataFrame column, directive rows), ...] """
+    header_lookup = {_norm_header(c): c for c in report_df.columns}
+    resolved = []
     for col_name in cfg["column"].unique():
         resolved_col = header_lookup.get(_norm_header(col_name))
         if not resolved_col:
             continue
+        resolved.append((col_name, resolved_col, cfg[cfg["column"] == col_name]))
+    return resolved
 
-        is_clean = cfg.loc[cfg["column"] == col_name, "clean"].any()
-        if is_clean:
-            clean_section = [[col_name.replace("_", " ").upper(), "", "Cleaned"]]
-            cleaned = report_df[resolved_col].apply(clean_list_string)
-            for val in cleaned:
-                clean_section.append(["", "", val])
-            sections.append(clean_section)
-            continue
 
-        if cfg.loc[cfg["column"] == col_name, "duplicate"].any():
-            raw = report_df[resolved_col].fillna("").astype(str)
-            counts = raw.value_counts()
-            duplicate = counts[counts > 1]
-            section = [[col_name.replace("_", " ").upper(), "Duplicates", "Instances"]]
-            for value, cnt in duplicate.items():
-                section.append(["", value, cnt])
-            sections.append(section)
-            continue
+def generate_column_report(
+    report_df: pd.DataFrame,
+    config_df: pd.DataFrame,
+    section_cache=None,
+    profiles=None,
+    segment_by=None,
+) -> list:
+    """
+    Build the report sections for every configured column.
+
+    When `section_cache` (a SectionCache) is given, each column section is
+    memoized on disk by the column's data plus its normalized directive rows,
+    so only sections whose data or directives changed are recomputed.
+    `profiles` (a DatasetProfile for `report_df`) lets DUPLICATE columns skip
+    their scan when an already computed profile shows every value distinct;
+    the report never profiles a column itself.
+    With `segment_by` every section also gets per-segment columns, computed
+    in one grouped pass (see segments.generate_segmented_report).
+    """
+    if segment_by:
+        from auto_report_pipeline.segments import generate_segmented_report
 
-        if cfg.loc[cfg["column"] == col_name, "average"].any():
-            raw = report_df[resolved_col].fillna("").astype(str)
-            if not raw.str.match(r"^\d+(\.\d+)?%?$").all():
-                sections.append(
-                    [
-                        [col_name.replace("_", " ").upper(), "", "Average"],
-                        ["Non-digit field", "", ""],
-                    ]
-                )
-            else:
-                nums = pd.to_numeric(raw.str.rstrip("%"), errors="coerce")
-                avg = nums.mean()
-                unit = "%" if raw.str.endswith("%").any() else ""
-                sections.append(
-                    [
-                        [col_name.replace("_", " ").upper(), "", "Average"],
-                        ["", "", f"{avg:.2f}{unit}"],
-                    ]
-                )
+        return generate_segmented_report(report_df, config_df, segment_by)[0]
+
+    total_rows = len(report_df)
+    cfg = _normalize_report_config(config_df)
+
+    sections = []
+    sections.append([["Total rows", "", total_rows]])
+
+    for col_name, resolved_col, entries in _resolve_report_columns(report_df, cfg):
+        column = report_df[resolved_col]
+        profile = profiles.cached(resolved_col) if profiles is not None else None
+        if section_cache is None:
+            sections.append(
+                _column_section(col_name, column, entries, total_rows, profile)
+            )
             continue
 
-        entries = cfg[cfg["column"] == col_name]
-        label_counts = {}
-        search_value = entries[entries["value"] != ""]
-
-        if not search_value.empty:
-            for _, r in search_value.iterrows():
-                series = report_df[resolved_col].fillna("").astype(str)
-                if r["separate_nodes"]:
-                    items = (
-                        series.str.split(
-                            rf"\s*{re.escape(r["delimiter"])}\s*", regex=True
-                        )
-                        .explode()
-                        .dropna()
-                        .str.strip()
-                        .str.lower()
-                        .apply(clean_list_string)
-                    )
-                    cnt = int((items == r["value"]).sum())
-                else:
-                    if r["root_only"]:
-                        series = _apply_root_only(series, r["delimiter"])
-                    pattern = rf"(?:^|\|)\s*{re.escape(r["value"])}\s*(?:\||$)"
-                    cnt = int(series.str.lower().str.contains(pattern).sum())
-                label = r["value"] or "None"
-                label_counts[label] = cnt
-        else:
-            for _, r in entries.iterrows():
-                series = report_df[resolved_col].fillna("").astype(str)
-                if r["separate_nodes"]:
-                    items = (
-                        series.str.split(
-                            rf"\s*{re.escape(r["delimiter"])}\s*", regex=True
-                        )
-                        .explode()
-                        .dropna()
-                        .str.strip()
-                        .str.lower()
-                    )
-                    for val in items:
-                        label = val or "None"
-                        label_counts[label] = label_counts.get(label, 0) + 1
-                elif r["aggregate"]:
-                    if r["root_only"]:
-                        series = _apply_root_only(series, r["delimiter"])
-                    for val in sorted(series.str.strip().str.lower().unique()):
-                        if not val.strip():
-                            continue
-                        label = val
-                        cnt = int((series.str.strip().str.lower() == val).sum())
-                        label_counts[label] = cnt
-                else:
-                    if r["root_only"]:
-                        series = _apply_root_only(series, r["delimiter"])
-                    pattern = rf"(?:^|\|)\s*{re.escape(r["value"])}\s*(?:\||$)"
-                    cnt = int(series.str.lower().str.contains(pattern).sum())
-                    label = r["value"] or "None"
-                    label_counts[label] = label_counts.get(label, 0) + cnt
-
-        section = [[col_name.replace("_", " ").upper(), "%", "Count"]]
-        for label, cnt in label_counts.items():
-            pct = round(cnt / total_rows * 100, 2)
-            section.append([label, f"{pct:.2f}%", cnt])
+        key = section_cache.key(col_name, column, entries)
+        section = section_cache.get(key)
+        if section is None:
+            section = _column_section(col_name, column, entries, total_rows, profile)
+            section_cache.put(key, section)
         sections.append(section)
 
+    if section_cache is not None:
+        section_cache.report()
     return sections
 
 
@@ -233,32 +412,48 @@ def is_categorical_column(series: pd.Series, max_unique_values: int = 20) -> boo
 
 
 def cramers_v_stat(col_a: pd.Series, col_b: pd.Series) -> float:
-    """ Cramér's V for two categorical columns """
-    contingency_table = pd.crosstab(col_a, col_b)
-    if contingency_table.shape[0] < 2 or contingency_table.shape[1] < 2:
-        return np.nan
+    """ Cramér's V for two categorical columns (from a sparse crosstab) """
+    return sparse_crosstab(col_a, col_b).cramers_v()
 
-    observed = contingency_table.values.astype(float)
-    total = observed.sum()
-    if total == 0:
-        return np.nan
 
-    row_totals = observed.sum(axis=1, keepdims=True)
-    col_totals = observed.sum(axis=0, keepdims=True)
-    expected = row_totals @ col_totals / total
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        chi_square = np.nansum((observed - expected) ** 2 / expected)
-
-    rows, cols = observed.shape
-    phi2 = chi_square / total
+def _pair_statistic(src_vals, tgt_vals, src_num, tgt_num, src_cat, tgt_cat):
+    """
+    (pair type, statistic, sparse crosstab or None) for one column pair, or
+    None when the pair is neither numeric, categorical nor mixed.
+    """
+    # Numeric - Numeric
+    if src_num and tgt_num:
+        return "pearson", src_vals.corr(tgt_vals), None
+
+    # Categorical - Categorical
+    if src_cat and tgt_cat:
+        ctab = sparse_crosstab(src_vals, tgt_vals)
+        return "cramers_v", ctab.cramers_v(), ctab
+
+    # Mixed (Categorical - Numeric)
+    if (src_cat and tgt_num) or (src_num and tgt_cat):
+        cat_vals, num_vals = (src_vals, tgt_vals) if src_cat else (tgt_vals, src_vals)
+        dummies = pd.get_dummies(cat_vals)
+        max_abs_corr = (
+            dummies.corrwith(num_vals).abs().max() if not dummies.empty else 0.0
+        )
+        return "mixed", max_abs_corr, None
+    return None
 
-    phi2_corrected = max(0.0, phi2 - ((cols - 1) * (rows - 1)) / (total - 1))
-    rows_corrected = rows - ((rows - 1) ** 2) / (total - 1)
-    cols_corrected = cols - ((cols - 1) ** 2) / (total - 1)
-    denom = min((cols_corrected - 1), (rows_corrected - 1))
 
-    return np.sqrt(phi2_corrected / denom) if denom > 0 else np.nan
+def _write_crosstab(writer, ctab, src_col, tgt_col, crosstab_format, max_cells):
+    if crosstab_format == "long":
+        writer.writerows(ctab.long_rows(src_col, tgt_col))
+    elif ctab.cells <= max_cells:
+        writer.writerow([f"=== Crosstab: {src_col} vs {tgt_col} ==="])
+        writer.writerows(ctab.wide_rows(src_col))
+        writer.writerow([])
+    else:
+        rows, cols = ctab.shape
+        writer.writerow([f"=== Crosstab (long): {src_col} vs {tgt_col} [{rows}x{cols}] ==="])
+        writer.writerow([src_col, tgt_col, "count"])
+        writer.writerows(ctab.cell_rows())
+        writer.writerow([])
 
 
 def compute_correlations_and_crosstabs(
@@ -270,8 +465,45 @@ def compute_correlations_and_crosstabs(
     correlations_output_path: str = "auto_report_pipeline/csv_files/correlation_results.csv",
     verbose: bool = True,
     include_type: bool = False,
+    profiles=None,
+    max_unique_ratio: float = 0.95,
+    crosstab_format: str = "wide",
+    max_crosstab_cells: int = 10_000,
+    sample: Optional[float] = None,
+    sample_seed: int = 0,
+    sample_stratify: Optional[str] = None,
+    confidence: float = 0.95,
+    bootstrap_rounds: int = 200,
+    output_format: str = "csv",
 ) -> pd.DataFrame:
-    """ Compare selected columns and persist crosstabs and strongest correlations. """
+    """
+    Compare selected columns and persist crosstabs and strongest correlations.
+
+    With `profiles` (a DatasetProfile) column types come from the shared
+    profile instead of per-pair nunique/dtype checks, and pairs involving a
+    near-unique (ID-like) categorical column are skipped up front.
+
+    Crosstabs are counted sparsely from factorized codes. `crosstab_format`
+    "wide" writes one source x target grid per pair, falling back to
+    (source value, target value, count) rows for tables over
+    `max_crosstab_cells`; "long" writes every pair as one tidy
+    source_column,target_column,source_value,target_value,count table.
+
+    With `sample` (a row count, or a fraction when < 1) statistics and
+    crosstabs come from a seeded sample (stratified by `sample_stratify`).
+    Each statistic gets a `confidence` interval (Fisher z for correlations,
+    multinomial bootstrap for Cramér's V): pairs entirely above the threshold
+    are kept, pairs entirely below are dropped, and only pairs whose interval
+    straddles the threshold are re-computed on the full data. Mixed
+    (categorical x numeric) pairs have no valid interval, and a statistic
+    that is undefined on the sample (e.g. a rare level was not drawn) has
+    none either: both are always re-computed on the full data.
+
+    `output_format` picks the sink for both files (see sinks.OUTPUT_FORMATS).
+    CSV variants stream crosstab blocks through one buffered (optionally
+    compressed) handle; Parquet/JSONL append every crosstab in the long
+    layout to a TableSink as soon as it is counted.
+    """
     from pandas.api.types import is_numeric_dtype
 
     correlation_rows = []
@@ -287,101 +519,160 @@ def compute_correlations_and_crosstabs(
         if missing_targets:
             print(f"[insights] Skipping missing target columns: {missing_targets}")
 
-    with open(crosstab_output_path, mode="w", newline="", encoding="utf-8") as fh:
-        writer = csv.writer(fh)
+    work_df = dataframe
+    if sample:
+        n = sample_rows(len(dataframe), sample)
+        work_df = draw_sample(dataframe, n, seed=sample_seed, stratify=sample_stratify)
+        if len(work_df) < len(dataframe):
+            strata = f", stratified by {sample_stratify}" if sample_stratify else ""
+            print(
+                f"[insights] Sampling {len(work_df)} of {len(dataframe)} rows "
+                f"(seed {sample_seed}{strata})"
+            )
+    sampling = work_df is not dataframe
+
+    def _pair_values(frame, src_col, tgt_col):
+        src_series, tgt_series = frame[src_col], frame[tgt_col]
+        mask = src_series.notna() & tgt_series.notna()
+        return src_series[mask], tgt_series[mask]
+
+    columnar = output_format in COLUMNAR_FORMATS
+    if columnar:
+        sink = TableSink(crosstab_output_path, output_format, LONG_HEADER)
+    else:
+        sink = open_csv_sink(crosstab_output_path, output_format)
+    with sink as fh:
+        writer = None if columnar else csv.writer(fh)
+        if writer is not None and crosstab_format == "long":
+            writer.writerow(LONG_HEADER)
 
         for src_col in available_sources:
             for tgt_col in available_targets:
-                src_series = dataframe[src_col]
-                tgt_series = dataframe[tgt_col]
+                src_prof = tgt_prof = None
+                if profiles is not None:
+                    src_prof, tgt_prof = profiles.get(src_col), profiles.get(tgt_col)
+                if src_prof is not None and tgt_prof is not None:
+                    hopeless = [
+                        p.name
+                        for p in (src_prof, tgt_prof)
+                        if p.kind != "numeric" and p.is_near_unique(max_unique_ratio)
+                    ]
+                    if hopeless:
+                        if verbose:
+                            print(
+                                f"[insights] Skipped {src_col} vs {tgt_col}: "
+                                f"near-unique column(s) {hopeless}"
+                            )
+                        continue
+                    if src_prof.non_null == 0 or tgt_prof.non_null == 0:
+                        continue
 
-                mask = src_series.notna() & tgt_series.notna()
-                if mask.sum() == 0:
+                src_vals, tgt_vals = _pair_values(work_df, src_col, tgt_col)
+                if src_vals.empty:
                     continue
 
-                src_vals = src_series[mask]
-                tgt_vals = tgt_series[mask]
+                if src_prof is not None and tgt_prof is not None:
+                    kinds = (
+                        src_prof.kind == "numeric",
+                        tgt_prof.kind == "numeric",
+                        src_prof.is_categorical(),
+                        tgt_prof.is_categorical(),
+                    )
+                else:
+                    kinds = (
+                        is_numeric_dtype(src_vals),
+                        is_numeric_dtype(tgt_vals),
+                        is_categorical_column(src_vals),
+                        is_categorical_column(tgt_vals),
+                    )
 
                 try:
-                    # Numeric - Numeric
-                    if is_numeric_dtype(src_vals) and is_numeric_dtype(tgt_vals):
-                        pearson = src_vals.corr(tgt_vals)
-                        if (
-                            pearson is not None
-                            and np.isfinite(pearson)
-                            and abs(pearson) >= correlation_threshold
-                        ):
-                            row = {
-                                "Source Column": src_col,
-                                "Target Column": tgt_col,
-                                "Correlation": round(float(pearson), 4),
-                            }                            
-                            if include_type:
-                                row["Type"] = "Positive" if pearson > 0 else "Negative"
-                            correlation_rows.append(row)
-
-                    # Categorical - Categorical
-                    elif is_categorical_column(src_vals) and is_categorical_column(
-                        tgt_vals
-                    ):
-                        ctab = pd.crosstab(src_vals, tgt_vals)
-                        writer.writerow([f"=== Crosstab: {src_col} vs {tgt_col} ==="])
-                        writer.writerow(
-                            [ctab.index.name or src_col] + list(ctab.columns)
+                    result = _pair_statistic(src_vals, tgt_vals, *kinds)
+                    if result is None:
+                        continue
+                    pair_type, stat, ctab = result
+                    if ctab is not None and columnar:
+                        fh.write(ctab.long_frame(src_col, tgt_col))
+                    elif ctab is not None:
+                        _write_crosstab(
+                            writer, ctab, src_col, tgt_col, crosstab_format, max_crosstab_cells
                         )
-                        for idx, row in ctab.iterrows():
-                            writer.writerow([idx] + list(row.values))
-                        writer.writerow([])
-
-                        v = cramers_v_stat(src_vals, tgt_vals)
-                        if (
-                            v is not None
-                            and np.isfinite(v)
-                            and v >= correlation_threshold
-                        ):
-                            row = {
-                                "Source Column": src_col,
-                                "Target Column": tgt_col,
-                                "Correlation": round(float(v), 4),
-                            }
-                            if include_type:
-                                row["Type"] = "N/A"
-                            correlation_rows.append(row)
-
-                    # Mixed (Categorical - Numeric)
-                    elif (
-                        is_categorical_column(src_vals) and is_numeric_dtype(tgt_vals)
-                    ) or (
-                        is_numeric_dtype(src_vals) and is_categorical_column(tgt_vals)
-                    ):
-                        cat_vals, num_vals = (
-                            (src_vals, tgt_vals)
-                            if is_categorical_column(src_vals)
-                            else (tgt_vals, src_vals)
-                        )
-                        dummies = pd.get_dummies(cat_vals)
-                        max_abs_corr = (
-                            dummies.corrwith(num_vals).abs().max()
-                            if not dummies.empty
-                            else 0.0
-                        )
-                        if verbose:
-                            print(
-                                f"[insights] {src_col} vs {tgt_col}: mixed max |r|={max_abs_corr:.4f}"
+                    if pair_type == "mixed" and verbose:
+                        print(f"[insights] {src_col} vs {tgt_col}: mixed max |r|={stat:.4f}")
+                    defined = stat is not None and np.isfinite(stat)
+                    if not defined and not sampling:
+                        continue
+
+                    extra = {}
+                    if sampling:
+                        if not defined:
+                            # E.g. a rare level missing from the sample leaves
+                            # Cramér's V undefined: settle it on the full data
+                            lo, hi = 0.0, 1.0
+                        elif pair_type == "cramers_v":
+                            lo, hi = bootstrap_cramers_v(
+                                ctab, bootstrap_rounds, sample_seed, confidence
                             )
-                        if (
-                            max_abs_corr is not None
-                            and np.isfinite(max_abs_corr)
-                            and max_abs_corr >= correlation_threshold
-                        ):
-                            row = {
-                                "Source Column": src_col,
-                                "Target Column": tgt_col,
-                                "Correlation": round(float(max_abs_corr), 4),
+                        elif pair_type == "pearson":
+                            lo, hi = strength_interval(
+                                *fisher_interval(stat, len(src_vals), confidence)
+                            )
+                        else:
+                            # Max |r| over category dummies has no analytic interval
+                            # and is biased upward on small samples: always settle
+                            # mixed pairs on the full data
+                            lo, hi = 0.0, 1.0
+                        if hi < correlation_threshold:
+                            continue
+                        extra = {
+                            "CI Low": round(lo, 4),
+                            "CI High": round(hi, 4),
+                            "Basis": "sample",
+                            "Rows": len(src_vals),
+                        }
+                        if lo < correlation_threshold:
+                            # Interval straddles the threshold: settle it on the full data
+                            full_src, full_tgt = _pair_values(dataframe, src_col, tgt_col)
+                            stat = _pair_statistic(full_src, full_tgt, *kinds)[1]
+                            if verbose and not defined:
+                                print(
+                                    f"[insights] {src_col} vs {tgt_col}: undefined on the "
+                                    "sample; re-checked on full data"
+                                )
+                            elif verbose and pair_type == "mixed":
+                                print(
+                                    f"[insights] {src_col} vs {tgt_col}: mixed pair "
+                                    "re-checked on full data"
+                                )
+                            elif verbose:
+                                print(
+                                    f"[insights] {src_col} vs {tgt_col}: sample interval "
+                                    f"[{lo:.4f}, {hi:.4f}] straddles {correlation_threshold}; "
+                                    "re-checked on full data"
+                                )
+                            if stat is None or not np.isfinite(stat):
+                                continue
+                            extra = {
+                                "CI Low": "",
+                                "CI High": "",
+                                "Basis": "full",
+                                "Rows": len(full_src),
                             }
-                            if include_type:
-                                row["Type"] = "Mixed"
-                            correlation_rows.append(row)
+                    if extra.get("Basis") != "sample" and abs(stat) < correlation_threshold:
+                        continue
+
+                    row = {
+                        "Source Column": src_col,
+                        "Target Column": tgt_col,
+                        "Correlation": round(float(stat), 4),
+                    }
+                    if include_type:
+                        if pair_type == "pearson":
+                            row["Type"] = "Positive" if stat > 0 else "Negative"
+                        else:
+                            row["Type"] = "N/A" if pair_type == "cramers_v" else "Mixed"
+                    row.update(extra)
+                    correlation_rows.append(row)
                 except Exception as e:
                     if verbose:
                         print(f"[insights] Skipped {src_col} vs {tgt_col}: {e}")
@@ -393,7 +684,7 @@ def compute_correlations_and_crosstabs(
         if not results_df.empty
         else results_df
     )
-    results_df.to_csv(correlations_output_path, index=False)
+    write_table(results_df, correlations_output_path, output_format)
 
     print(f"✅ Correlation results → {correlations_output_path}")
     print(f"✅ Crosstabs written → {crosstab_output_path}")
@@ -425,6 +716,12 @@ def _parse_insights_from_config(config_df: pd.DataFrame) -> Dict[str, object]:
         "threshold": 0.2,
         "sources": None,
         "targets": None,
+        "crosstab_format": "wide",
+        "crosstab_max_cells": 10_000,
+        "sample": None,
+        "sample_seed": 0,
+        "sample_stratify": None,
+        "confidence": 0.95,
     }
     if config_df is None or config_df.empty or "column" not in config_df.columns:
         return out
@@ -441,6 +738,12 @@ def _parse_insights_from_config(config_df: pd.DataFrame) -> Dict[str, object]:
             "insightsthreshold",
             "insightssources",
             "insightstargets",
+            "insightscrosstabformat",
+            "insightscrosstabmaxcells",
+            "insightssample",
+            "insightssampleseed",
+            "insightssamplestratify",
+            "insightsconfidence",
         }:
             lut[key_norm] = r["value"]
 
@@ -472,6 +775,30 @@ def _parse_insights_from_config(config_df: pd.DataFrame) -> Dict[str, object]:
     if tgts:
         out["targets"] = tgts
 
+    # crosstab layout: "wide" grids up to a cell limit, or one "long" table
+    fmt = lut.get("insightscrosstabformat", "").strip().lower()
+    if fmt in CROSSTAB_FORMATS:
+        out["crosstab_format"] = fmt
+    elif fmt:
+        print(f"[insights] Ignoring unknown crosstab format: {fmt!r}")
+    max_cells = _as_float(lut.get("insightscrosstabmaxcells", ""))
+    if max_cells is not None:
+        out["crosstab_max_cells"] = int(max_cells)
+
+    # sampling: row count (or fraction < 1), seed, optional strata column
+    sample = _as_float(lut.get("insightssample", ""))
+    if sample is not None and sample > 0:
+        out["sample"] = sample
+    seed = _as_float(lut.get("insightssampleseed", ""))
+    if seed is not None:
+        out["sample_seed"] = int(seed)
+    stratify = lut.get("insightssamplestratify", "").strip()
+    if stratify and stratify.lower() != "nan":
+        out["sample_stratify"] = stratify
+    confidence = _as_float(lut.get("insightsconfidence", ""))
+    if confidence is not None and 0 < confidence < 1:
+        out["confidence"] = confidence
+
     return out
 
 
@@ -480,9 +807,12 @@ def run_basic_insights(
     config_df: Optional[pd.DataFrame] = None,
     threshold: Optional[float] = None,
     output_dir: str = "auto_report_pipeline/csv_files",
+    profiles=None,
+    output_format: str = "csv",
 ):
     """
     Run minimal correlations if expected columns are present; write outputs next to report
+    (in `output_format`, e.g. crosstabs_output.csv.gz or correlation_results.parquet)
     """
     directives = _parse_insights_from_config(config_df)
     if directives.get("enabled") is False:
@@ -512,6 +842,8 @@ def run_basic_insights(
         )
         df_work = dataframe.copy()
         df_work.columns = _make_unique(df_work.columns)
+        # Profiles are keyed by the original names; fall back to per-pair checks
+        profiles = None
     else:
         df_work = dataframe
 
@@ -569,8 +901,17 @@ def run_basic_insights(
         )
         return None
 
-    crosstab_path = f"{output_dir}/crosstabs_output.csv"
-    correlation_path = f"{output_dir}/correlation_results.csv"
+    stratify_col = None
+    if directives["sample_stratify"]:
+        resolved, _ = _resolve_existing_columns(df_work, [directives["sample_stratify"]])
+        stratify_col = resolved[0] if resolved else None
+        if stratify_col is None:
+            print(
+                f"[insights] Sample strata column not found: {directives['sample_stratify']}"
+            )
+
+    crosstab_path = output_path_for(f"{output_dir}/crosstabs_output.csv", output_format)
+    correlation_path = output_path_for(f"{output_dir}/correlation_results.csv", output_format)
 
     return compute_correlations_and_crosstabs(
         df_work,
@@ -579,4 +920,12 @@ def run_basic_insights(
         correlation_threshold=eff_threshold,
         crosstab_output_path=crosstab_path,
         correlations_output_path=correlation_path,
+        profiles=profiles,
+        crosstab_format=directives["crosstab_format"],
+        max_crosstab_cells=directives["crosstab_max_cells"],
+        sample=directives["sample"],
+        sample_seed=directives["sample_seed"],
+        sample_stratify=stratify_col,
+        confidence=directives["confidence"],
+        output_format=output_format,
     )
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 import re
+from collections import Counter
+from pandas.api.types import is_bool_dtype
 
 
 def safe_lower(val):
@@ -30,3 +33,112 @@ def clean_list_string(val):
     val = re.sub(r"[^a-zA-Z0-9, ]+", " ", val)
     val = re.sub(r"\s+", " ", val)
     return val.strip()
+
+
+_CELL_SEP = "\x00"
+
+
+def count_delimited_tokens(
+    series: pd.Series, delimiter: str, chunk_rows: int = 100_000
+) -> dict:
+    """
+    Count the stripped, lower-cased tokens of delimiter-separated cells.
+
+    Same result as `series.str.split(r"\\s*<delim>\\s*").explode().str.strip()
+    .str.lower().value_counts(sort=False)` (first-appearance order, "" for empty
+    tokens) but without materializing the exploded Series: each chunk of cells
+    is joined into one buffer, split by a single C-level regex pass and counted
+    with a Counter, so peak memory is bounded by `chunk_rows`.
+    """
+    delim = re.escape(str(delimiter))
+    split_cells = re.compile(rf"\s*(?:{delim}|{_CELL_SEP})\s*")
+    split_one = re.compile(rf"\s*{delim}\s*")
+
+    counts = Counter()
+    for start in range(0, len(series), chunk_rows):
+        cells = series.iloc[start : start + chunk_rows].tolist()
+        buf = _CELL_SEP.join(cells)
+        if buf.count(_CELL_SEP) == len(cells) - 1:
+            counts.update(split_cells.split(buf.strip()))
+        else:
+            # A cell contains the separator itself; split cell by cell
+            for cell in cells:
+                counts.update(tok.strip() for tok in split_one.split(cell))
+
+    # Fold case on distinct tokens only; keeps first-appearance order
+    folded = {}
+    for tok, cnt in counts.items():
+        key = tok.lower()
+        folded[key] = folded.get(key, 0) + cnt
+    return folded
+
+
+def split_delimited_tokens(
+    series: pd.Series, delimiter: str, chunk_rows: int = 100_000
+) -> tuple[list, np.ndarray]:
+    """
+    The stripped tokens of delimiter-separated cells (split exactly like
+    `count_delimited_tokens`, case not folded) and the row position of each
+    token. Cell boundaries are a captured alternative of the same single
+    regex pass, so every separator match tells whether a new row starts.
+    """
+    delim = re.escape(str(delimiter))
+    split_cells = re.compile(rf"\s*(?:{delim}|({_CELL_SEP}))\s*")
+    split_one = re.compile(rf"\s*{delim}\s*")
+
+    tokens, rows = [], []
+    for start in range(0, len(series), chunk_rows):
+        cells = series.iloc[start : start + chunk_rows].tolist()
+        buf = _CELL_SEP.join(cells)
+        if buf.count(_CELL_SEP) == len(cells) - 1:
+            parts = split_cells.split(buf.strip())
+            tokens.extend(parts[0::2])
+            new_row = np.array([sep is not None for sep in parts[1::2]], dtype=np.int64)
+            rows.append(start + np.concatenate([[0], np.cumsum(new_row)]))
+        else:
+            # A cell contains the separator itself; split cell by cell
+            for i, cell in enumerate(cells):
+                cell_tokens = [tok.strip() for tok in split_one.split(cell)]
+                tokens.extend(cell_tokens)
+                rows.append(np.full(len(cell_tokens), start + i, dtype=np.int64))
+    return tokens, np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+
+
+def _is_arrow_backed(dtype) -> bool:
+    """True for ArrowDtype columns and pyarrow-backed StringDtype columns."""
+    if isinstance(dtype, pd.ArrowDtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Blank-filled string view of a column.
+
+    Arrow-backed string columns stay on Arrow (string kernels, no object
+    round-trip); everything else keeps the historical `fillna("").astype(str)`
+    behavior. Arrow numbers and booleans are first converted to what the
+    default reader would have loaded, so both engines render "1.0" for an
+    integer column with blanks and "True" for booleans.
+    """
+    dtype = series.dtype
+    if _is_arrow_backed(dtype):
+        if pd.api.types.is_string_dtype(dtype):
+            return series.fillna("")
+        if is_bool_dtype(dtype):
+            series = series.astype(object)
+        elif pd.api.types.is_integer_dtype(dtype) and series.hasnans:
+            series = series.astype("float64")
+        elif pd.api.types.is_numeric_dtype(dtype):
+            series = series.astype(dtype.numpy_dtype)
+        else:
+            import pyarrow as pa
+
+            return series.astype(pd.ArrowDtype(pa.string())).fillna("")
+    return series.fillna("").astype(str)
+
+
+def _norm_header(s: str) -> str:
+    s = str(s).strip()
+    s = re.sub(r"^[\"']+|[\"']+$", "", s)
+    s = re.sub(r"\s+", " ", s)
+    return s.lower().replace(" ", "_")
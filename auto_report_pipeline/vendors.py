@@ -0,0 +1,201 @@
+import csv
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from auto_report_pipeline.utils import _as_text, _norm_header
+
+# Letters and digits of any script; "_" and punctuation separate tokens
+_TOKEN = re.compile(r"[^\W_]+")
+_ROW_SEP = "\x00"
+_SCAN = re.compile(r"[^\W_]+|\x00")
+_END = ""  # trie key marking the end of a vendor name (tokens are never empty)
+# Combining marks left over by NFKD (all of them are below U+20000)
+_COMBINING = {cp: None for cp in range(0x20000) if unicodedata.combining(chr(cp))}
+
+
+def _fold(text: str) -> str:
+    """ Casefold and strip accents: "Café", "CAFE" and "café" all fold to "cafe" """
+    if text.isascii():
+        return text.lower()
+    return unicodedata.normalize("NFKD", text.casefold()).translate(_COMBINING)
+
+
+class VendorMatcher:
+    """
+    Whole vendor list compiled into one token trie.
+
+    Vendor names and cells are casefolded, stripped of accents and split
+    into letter/digit tokens of any script, so "AT&T", "at & t" and "At-T"
+    all match the same vendor, as do "Café Rouge" and "cafe rouge". A cell
+    is scanned left to right taking the longest vendor starting at each
+    token and continuing after it: "Google Maps" counts for "Google Maps"
+    only, never also for "Google". The cost per cell depends on its token
+    count, not on the number of vendors.
+    """
+
+    def __init__(self, vendors: Iterable[str]):
+        self.names: list[str] = []
+        self._trie: dict = {}
+        for name in vendors:
+            if name is None or (isinstance(name, float) and np.isnan(name)):
+                continue
+            tokens = _TOKEN.findall(_fold(str(name)))
+            if not tokens:
+                print(f"[vendors] Ignoring vendor name without letters or digits: {name!r}")
+                continue
+            node = self._trie
+            for tok in tokens:
+                node = node.setdefault(tok, {})
+            if _END not in node:  # first spelling of a name wins
+                node[_END] = len(self.names)
+                self.names.append(str(name).strip())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _longest(self, node: dict, tokens: list, i: int, n: int):
+        """ (vendor id, end) of the longest vendor starting at tokens[i], or None """
+        best = None
+        while node is not None:
+            i += 1
+            if _END in node:
+                best = (node[_END], i)
+            node = node.get(tokens[i]) if i < n else None
+        return best
+
+    def match_tokens(self, tokens: list) -> list[int]:
+        """ Vendor ids found in one tokenized cell, in order of appearance """
+        found = []
+        i, n = 0, len(tokens)
+        while i < n:
+            node = self._trie.get(tokens[i])
+            best = self._longest(node, tokens, i, n) if node is not None else None
+            if best is None:
+                i += 1
+            else:
+                found.append(best[0])
+                i = best[1]
+        return found
+
+    def scan(self, series: pd.Series, chunk_rows: int = 100_000) -> tuple[np.ndarray, np.ndarray]:
+        """
+        One pass over a column: (row position, vendor id) for every match.
+
+        Each chunk of cells is joined into one buffer with a row separator
+        and tokenized by a single regex pass; the trie walk then runs over the
+        flat token stream (the separator never continues a vendor name).
+        """
+        trie, longest = self._trie, self._longest
+        rows, ids = [], []
+        text = _as_text(series)
+        for start in range(0, len(text), chunk_rows):
+            cells = text.iloc[start : start + chunk_rows].tolist()
+            buf = _ROW_SEP.join(cells)
+            if buf.count(_ROW_SEP) != len(cells) - 1:
+                buf = _ROW_SEP.join(c.replace(_ROW_SEP, " ") for c in cells)
+            tokens = _SCAN.findall(_fold(buf))
+            row = start
+            i, n = 0, len(tokens)
+            while i < n:
+                tok = tokens[i]
+                if tok == _ROW_SEP:
+                    row += 1
+                    i += 1
+                    continue
+                node = trie.get(tok)
+                best = longest(node, tokens, i, n) if node is not None else None
+                if best is None:
+                    i += 1
+                else:
+                    rows.append(row)
+                    ids.append(best[0])
+                    i = best[1]
+        return np.asarray(rows, dtype=np.int64), np.asarray(ids, dtype=np.int64)
+
+
+def analyze_vendor_column(
+    df: pd.DataFrame,
+    column: str,
+    vendors: Iterable[str],
+    matcher: Optional[VendorMatcher] = None,
+) -> tuple[pd.Series, pd.Series, pd.DataFrame]:
+    """
+    Match every vendor of `vendors` against `column` in a single scan.
+
+    Returns
+      vendor_counts    rows mentioning each vendor (most frequent first); a
+                       mention inside a longer vendor name counts for the
+                       longer vendor only ("Google Maps" is not "Google")
+      vendor_dups      rows listing the same vendor more than once, per vendor
+      vendor_dup_rows  those rows: row index, duplicated vendor(s), cell value
+    Pass a prebuilt `matcher` to reuse one compiled vendor list across calls.
+    """
+    matcher = matcher or VendorMatcher(vendors)
+    header_lookup = {_norm_header(c): c for c in df.columns}
+    resolved = header_lookup.get(_norm_header(column))
+    if resolved is None:
+        raise KeyError(f"Vendor column {column!r} not found")
+    series = df[resolved]
+
+    # Distinct (row, vendor) pairs and how often each occurs within its row
+    n_vendors = max(len(matcher), 1)
+    rows, ids = matcher.scan(series)
+    pairs, per_row = np.unique(rows * n_vendors + ids, return_counts=True)
+    pair_row, pair_vendor = np.divmod(pairs, n_vendors)
+    dup = per_row > 1
+
+    names = pd.Index(matcher.names, name="vendor")
+
+    def _ranked(vendor_ids: np.ndarray) -> pd.Series:
+        out = pd.Series(np.bincount(vendor_ids, minlength=len(names)), index=names, name="rows")
+        return out[out > 0].sort_values(ascending=False, kind="stable")
+
+    dup_pairs = pd.DataFrame(
+        {"row": pair_row[dup], "duplicate_vendors": names[pair_vendor[dup]]}
+    )
+    dup_rows = dup_pairs.groupby("row", sort=True)["duplicate_vendors"].agg("|".join)
+    positions = dup_rows.index.to_numpy()
+    vendor_dup_rows = pd.DataFrame(
+        {
+            "row": series.index[positions],
+            "duplicate_vendors": dup_rows.to_numpy(),
+            resolved: series.iloc[positions].to_numpy(),
+        }
+    )
+    return _ranked(pair_vendor), _ranked(pair_vendor[dup]), vendor_dup_rows
+
+
+def export_vendor_stats_to_csv(
+    vendor_counts: pd.Series,
+    vendor_dups: pd.Series,
+    vendor_dup_rows: pd.DataFrame,
+    output_path: str,
+):
+    """ Write the three vendor tables as titled blocks of one CSV """
+    with open(output_path, mode="w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["=== Vendor counts ==="])
+        writer.writerow(["Vendor", "Rows"])
+        writer.writerows(vendor_counts.items())
+        writer.writerow([])
+        writer.writerow(["=== Duplicate vendors ==="])
+        writer.writerow(["Vendor", "Rows"])
+        writer.writerows(vendor_dups.items())
+        writer.writerow([])
+        writer.writerow(["=== Duplicate rows ==="])
+        writer.writerow(list(vendor_dup_rows.columns))
+        writer.writerows(vendor_dup_rows.itertuples(index=False, name=None))
+    print(f"✅ Vendor stats written → {output_path}")
+
+
+def load_vendor_list(path: str) -> list[str]:
+    """ Vendor names from a text file (one per line) or the first column of a CSV """
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        rows = [row[0].strip() for row in csv.reader(fh) if row and row[0].strip()]
+    if rows and rows[0].lower() in ("vendor", "vendors", "name"):
+        rows = rows[1:]
+    return rows
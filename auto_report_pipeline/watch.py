@@ -0,0 +1,322 @@
+import os
+import time
+import threading
+from typing import Optional
+
+from auto_report_pipeline.extract import load_csv
+from auto_report_pipeline.profiling import DatasetProfile
+from auto_report_pipeline.pipeline import (
+    load_input,
+    read_io_from_config,
+    render_report,
+    resolve_engine,
+    resolve_output_format,
+    resolve_processes,
+    resolve_profile_path,
+    resolve_row_filter,
+    resolve_section_cache,
+    resolve_segmenting,
+)
+
+
+def _file_stamp(path: Optional[str]) -> Optional[tuple]:
+    """ Cheap change marker for a file: (mtime_ns, size), or None if missing """
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Settings that require re-reading INPUT when they change
+_INPUT_SETTINGS = ("input_path", "engine", "row_filter")
+
+
+class ReportWatcher:
+    """
+    Keeps the parsed report_config and the loaded input resident and regenerates
+    the report only when one of the watched files changes.
+
+    Changes are debounced: a file must keep the same stamp for `debounce`
+    seconds before it is reloaded, so editors/exports that write in several
+    steps trigger a single run. Only the piece that changed is reloaded; a
+    config change re-reads INPUT/OUTPUT and reloads the input only if the
+    INPUT path (or the ENGINE) changed.
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        input_path: Optional[str] = None,
+        output_path: Optional[str] = None,
+        use_config_io: bool = True,
+        debounce: float = 0.5,
+        analytics: bool = True,
+        engine: Optional[str] = None,
+        section_cache_dir: Optional[str] = None,
+        profile_path: Optional[str] = None,
+        processes: Optional[int] = None,
+        segment_by: Optional[str] = None,
+        segment_output: Optional[str] = None,
+        output_format: Optional[str] = None,
+        required_columns: Optional[str] = None,
+        filter_column: Optional[str] = None,
+        filter_value: Optional[str] = None,
+    ):
+        self.config_path = config_path
+        self.cli_row_filter = (required_columns, filter_column, filter_value)
+        self.cli_processes = processes
+        self.cli_segment_by = segment_by
+        self.cli_segment_output = segment_output
+        self.cli_output_format = output_format
+        self.cli_profile_path = profile_path
+        self.cli_engine = engine
+        self.cli_section_cache = section_cache_dir
+        self.cli_input = input_path
+        self.cli_output = output_path
+        self.use_config_io = use_config_io
+        self.debounce = debounce
+        self.analytics = analytics
+
+        self.input_path: Optional[str] = None
+        self.output_path: Optional[str] = None
+        self.engine: Optional[str] = None
+        self.row_filter = None
+        self.section_cache = None
+        self.profile_path: Optional[str] = None
+        self.profiles = None
+        self.processes = 1
+        self.segment_by: Optional[str] = None
+        self.segment_output = "columns"
+        self.output_format = "csv"
+        self.config_df = None
+        self.df = None
+        self.runs = 0
+
+        self._stamps: dict[str, Optional[tuple]] = {}
+        self._pending: dict[str, tuple] = {}
+
+    # ── loading ──────────────────────────────────────────────────────────
+    def _resolve_io(self) -> tuple[Optional[str], Optional[str]]:
+        cfg_input, cfg_output = (None, None)
+        if self.use_config_io:
+            try:
+                cfg_input, cfg_output = read_io_from_config(self.config_path)
+            except Exception as e:
+                print(f"[watch] Warning: could not read INPUT/OUTPUT from config: {e}")
+        return cfg_input or self.cli_input, cfg_output or self.cli_output
+
+    def _resolve_config(self) -> tuple[dict, Optional[tuple]]:
+        """
+        Read the config and resolve every setting derived from it, without
+        touching the resident state. Returns (settings, config file stamp).
+        """
+        stamp = _file_stamp(self.config_path)
+        config_df = load_csv(self.config_path)
+        input_path, output_path = self._resolve_io()
+        if not input_path:
+            raise ValueError("INPUT path not provided and not found in report_config.")
+        if not output_path:
+            raise ValueError("OUTPUT path not provided and not found in report_config.")
+        segment_by, segment_output = resolve_segmenting(
+            self.config_path, self.cli_segment_by, self.cli_segment_output
+        )
+        settings = {
+            "config_df": config_df,
+            "input_path": input_path,
+            "output_path": output_path,
+            "section_cache": resolve_section_cache(
+                self.config_path, self.cli_section_cache
+            ),
+            "profile_path": resolve_profile_path(
+                self.config_path, self.cli_profile_path
+            ),
+            "processes": resolve_processes(self.config_path, self.cli_processes),
+            "segment_by": segment_by,
+            "segment_output": segment_output,
+            "output_format": resolve_output_format(
+                self.config_path, self.cli_output_format
+            ),
+            "engine": resolve_engine(self.config_path, self.cli_engine),
+            "row_filter": resolve_row_filter(self.config_path, *self.cli_row_filter),
+        }
+        return settings, stamp
+
+    def _input_settings(self) -> dict:
+        return {key: getattr(self, key) for key in _INPUT_SETTINGS}
+
+    def _input_moved(self, settings: dict) -> bool:
+        """ True if INPUT (path, engine or row filter) differs from the resident one """
+        return any(settings[key] != value for key, value in self._input_settings().items())
+
+    def _read_input(self, settings: dict) -> tuple:
+        """ (df, profiles, input file stamp) for INPUT, without touching resident state """
+        stamp = _file_stamp(settings["input_path"])
+        df = load_input(
+            settings["input_path"],
+            engine=settings["engine"],
+            row_filter=settings["row_filter"],
+        )
+        return df, DatasetProfile(df), stamp
+
+    def _apply(self, config: Optional[tuple] = None, loaded: Optional[tuple] = None):
+        """ Swap in a resolved config and/or loaded input, all at once """
+        if config is not None:
+            settings, stamp = config
+            os.makedirs(os.path.dirname(settings["output_path"]) or ".", exist_ok=True)
+            for key, value in settings.items():
+                setattr(self, key, value)
+            self._stamps["config"] = stamp
+        if loaded is not None:
+            self.df, self.profiles, self._stamps["input"] = loaded
+
+    def _render(self, reason: str):
+        t0 = time.perf_counter()
+        render_report(
+            self.df,
+            self.config_df,
+            self.output_path,
+            analytics=self.analytics,
+            section_cache=self.section_cache,
+            profiles=self.profiles,
+            profile_path=self.profile_path,
+            processes=self.processes,
+            segment_by=self.segment_by,
+            segment_output=self.segment_output,
+            output_format=self.output_format,
+        )
+        self.runs += 1
+        elapsed = time.perf_counter() - t0
+        print(f"[watch] Run {self.runs} ({reason}) finished in {elapsed:.3f}s")
+
+    def start(self):
+        """ Initial load of config + input and a first report run """
+        t0 = time.perf_counter()
+        config = self._resolve_config()
+        loaded = self._read_input(config[0])
+        self._apply(config, loaded)
+        print(f"[watch] Loaded config + input in {time.perf_counter() - t0:.3f}s")
+        self._render("initial")
+
+    # ── change detection ────────────────────────────────────────────────
+    def _paths(self) -> dict[str, Optional[str]]:
+        return {"config": self.config_path, "input": self.input_path}
+
+    def poll(self, now: Optional[float] = None) -> set:
+        """
+        Check watched files and return the set of pieces ("config", "input")
+        whose change has settled for at least `debounce` seconds.
+        """
+        now = time.monotonic() if now is None else now
+        ready = set()
+        for name, path in self._paths().items():
+            stamp = _file_stamp(path)
+            if stamp == self._stamps.get(name):
+                self._pending.pop(name, None)
+                continue
+            if stamp is None:
+                # File vanished mid-write; wait for it to reappear
+                continue
+            last = self._pending.get(name)
+            if last is None or last[0] != stamp:
+                self._pending[name] = last = (stamp, now)
+            if now - last[1] >= self.debounce:
+                ready.add(name)
+        return ready
+
+    def refresh(self, changed: set) -> bool:
+        """ Reload only the changed pieces and regenerate; returns True if a run happened """
+        if not changed:
+            return False
+        t0 = time.perf_counter()
+        reloaded = []
+        config = loaded = None
+        try:
+            if "config" in changed:
+                reloaded.append("config")
+                config = self._resolve_config()
+                if self._input_moved(config[0]):
+                    changed = changed | {"input"}
+            if "input" in changed:
+                reloaded.append("input")
+                loaded = self._read_input(
+                    config[0] if config is not None else self._input_settings()
+                )
+        except Exception as e:
+            # Keep the previous resident state; the next change will retry
+            print(f"[watch] Reload failed ({', '.join(reloaded)}): {e}")
+            for name in changed:
+                self._stamps[name] = _file_stamp(self._paths()[name])
+                self._pending.pop(name, None)
+            return False
+        self._apply(config, loaded)
+        for name in changed:
+            self._pending.pop(name, None)
+        print(
+            f"[watch] Reloaded {', '.join(reloaded)} in {time.perf_counter() - t0:.3f}s"
+        )
+        try:
+            self._render("changed: " + ", ".join(reloaded))
+        except Exception as e:
+            print(f"[watch] Report run failed: {e}")
+            return False
+        return True
+
+
+def watch_report(
+    config_path: str,
+    input_path: Optional[str] = None,
+    output_path: Optional[str] = None,
+    use_config_io: bool = True,
+    interval: float = 1.0,
+    debounce: float = 0.5,
+    analytics: bool = True,
+    engine: Optional[str] = None,
+    section_cache_dir: Optional[str] = None,
+    profile_path: Optional[str] = None,
+    processes: Optional[int] = None,
+    segment_by: Optional[str] = None,
+    segment_output: Optional[str] = None,
+    output_format: Optional[str] = None,
+    required_columns: Optional[str] = None,
+    filter_column: Optional[str] = None,
+    filter_value: Optional[str] = None,
+    stop_event: Optional[threading.Event] = None,
+) -> ReportWatcher:
+    """
+    Long-running mode: keep imports, config and input resident and re-run the
+    report whenever the INPUT or config file changes. Stops on Ctrl+C or when
+    `stop_event` is set.
+    """
+    watcher = ReportWatcher(
+        config_path,
+        input_path=input_path,
+        output_path=output_path,
+        use_config_io=use_config_io,
+        debounce=debounce,
+        analytics=analytics,
+        engine=engine,
+        section_cache_dir=section_cache_dir,
+        profile_path=profile_path,
+        processes=processes,
+        segment_by=segment_by,
+        segment_output=segment_output,
+        output_format=output_format,
+        required_columns=required_columns,
+        filter_column=filter_column,
+        filter_value=filter_value,
+    )
+    watcher.start()
+    print(
+        f"[watch] Watching {watcher.config_path} and {watcher.input_path} "
+        f"(poll {interval}s, debounce {debounce}s). Ctrl+C to stop."
+    )
+    stop_event = stop_event or threading.Event()
+    try:
+        while not stop_event.wait(interval):
+            watcher.refresh(watcher.poll())
+    except KeyboardInterrupt:
+        print("[watch] Stopped.")
+    return watcher
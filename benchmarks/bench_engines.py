@@ -0,0 +1,58 @@
+"""
+Compare the default and pyarrow engines on the same report_config.
+
+    python benchmarks/bench_engines.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report_pipeline.extract import ENGINES, load_csv  # noqa: E402
+from auto_report_pipeline.pipeline import load_input  # noqa: E402
+from auto_report_pipeline.report_generator import assemble_report  # noqa: E402
+from auto_report_pipeline.transform import generate_column_report  # noqa: E402
+from data import make_benchmark_data, write_benchmark_config  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = make_benchmark_data(os.path.join(tmp, "input.csv"), args.rows)
+        config_path = write_benchmark_config(
+            os.path.join(tmp, "report_config.csv"), input_path, "report.csv"
+        )
+        config_df = load_csv(config_path)
+
+        reports = {}
+        print(f"rows={args.rows:,}  (best of {args.repeat})")
+        print(f"{'engine':<10}{'load s':>10}{'report s':>10}{'total s':>10}")
+        for engine in ENGINES:
+            best_load = best_report = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                df = load_input(input_path, engine=engine)
+                t1 = time.perf_counter()
+                report = assemble_report(generate_column_report(df, config_df))
+                t2 = time.perf_counter()
+                best_load = min(best_load, t1 - t0)
+                best_report = min(best_report, t2 - t1)
+            reports[engine] = report
+            print(
+                f"{engine:<10}{best_load:>10.3f}{best_report:>10.3f}"
+                f"{best_load + best_report:>10.3f}"
+            )
+
+        same = reports["default"].astype(str).equals(reports["pyarrow"].astype(str))
+        print(f"reports identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Write time and file size of the report, insights files and a large long
+crosstab in every output format (sinks.OUTPUT_FORMATS).
+
+    python benchmarks/bench_output.py --rows 1000000 --formats csv csv.gz parquet jsonl
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report_pipeline.crosstab import sparse_crosstab  # noqa: E402
+from auto_report_pipeline.extract import load_csv  # noqa: E402
+from auto_report_pipeline.pipeline import load_input  # noqa: E402
+from auto_report_pipeline.report_generator import assemble_report, save_report  # noqa: E402
+from auto_report_pipeline.sinks import (  # noqa: E402
+    OUTPUT_FORMATS,
+    available_output_format,
+    output_path_for,
+    write_table,
+)
+from auto_report_pipeline.transform import (  # noqa: E402
+    compute_correlations_and_crosstabs,
+    generate_column_report,
+)
+from data import make_benchmark_data, write_benchmark_config  # noqa: E402
+
+CATEGORICAL = ["ticket_type", "country", "resolution"]
+
+
+def _size_mb(path: str) -> float:
+    return os.path.getsize(path) / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--formats", nargs="+", default=list(OUTPUT_FORMATS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = make_benchmark_data(os.path.join(tmp, "input.csv"), args.rows)
+        config_path = write_benchmark_config(
+            os.path.join(tmp, "report_config.csv"), input_path, "report.csv"
+        )
+        df = load_input(input_path)
+        report_df = assemble_report(generate_column_report(df, load_csv(config_path)))
+        # place_id x country: one long crosstab with ~rows non-zero cells
+        big_ctab = sparse_crosstab(df["place_id"], df["country"]).long_frame(
+            "place_id", "country"
+        )
+
+        print(
+            f"rows={args.rows:,}  report rows={len(report_df):,}  "
+            f"long crosstab cells={len(big_ctab):,}"
+        )
+        print(f"{'format':>8} {'output':>18} {'seconds':>8} {'MB':>8}")
+        for requested in args.formats:
+            fmt = available_output_format(requested)
+            if fmt != requested:
+                continue
+            out_dir = os.path.join(tmp, fmt.replace(".", "_"))
+            os.makedirs(out_dir)
+
+            t0 = time.perf_counter()
+            report_path = save_report(report_df, os.path.join(out_dir, "report.csv"), fmt)
+            report_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            ctab_path = output_path_for(os.path.join(out_dir, "crosstabs_output.csv"), fmt)
+            corr_path = output_path_for(os.path.join(out_dir, "correlation_results.csv"), fmt)
+            compute_correlations_and_crosstabs(
+                df,
+                CATEGORICAL + ["score"],
+                CATEGORICAL + ["popularity"],
+                crosstab_output_path=ctab_path,
+                correlations_output_path=corr_path,
+                verbose=False,
+                output_format=fmt,
+            )
+            insights_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            big_path = output_path_for(os.path.join(out_dir, "big_crosstab.csv"), fmt)
+            write_table(big_ctab, big_path, fmt)
+            big_s = time.perf_counter() - t0
+
+            print(f"{fmt:>8} {'report':>18} {report_s:8.3f} {_size_mb(report_path):8.2f}")
+            print(
+                f"{fmt:>8} {'insights':>18} {insights_s:8.3f} "
+                f"{_size_mb(ctab_path) + _size_mb(corr_path):8.2f}"
+            )
+            print(f"{fmt:>8} {'long crosstab':>18} {big_s:8.3f} {_size_mb(big_path):8.2f}")
+
+
+if __name__ == "__main__":
+    main()
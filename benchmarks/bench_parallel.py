@@ -0,0 +1,54 @@
+"""
+Scaling of the row-partitioned report (generate_column_report_parallel).
+
+    python benchmarks/bench_parallel.py --rows 2000000 --workers 1 2 4 8 16
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auto_report_pipeline.extract import load_csv  # noqa: E402
+from auto_report_pipeline.parallel import generate_column_report_parallel  # noqa: E402
+from auto_report_pipeline.pipeline import load_input  # noqa: E402
+from auto_report_pipeline.transform import generate_column_report  # noqa: E402
+from data import make_benchmark_data, write_benchmark_config  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--engine", default="default", choices=["default", "pyarrow"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = make_benchmark_data(os.path.join(tmp, "input.csv"), args.rows)
+        config_path = write_benchmark_config(
+            os.path.join(tmp, "report_config.csv"), input_path, "report.csv"
+        )
+        df = load_input(input_path, engine=args.engine)
+        config_df = load_csv(config_path)
+
+        t0 = time.perf_counter()
+        expected = generate_column_report(df, config_df)
+        serial = time.perf_counter() - t0
+
+        print(f"rows={args.rows:,}  cpus={os.cpu_count()}  engine={args.engine}")
+        print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}  identical")
+        print(f"{'serial':>8}{serial:>10.3f}{1.0:>10.2f}  -")
+        for workers in args.workers:
+            t0 = time.perf_counter()
+            sections = generate_column_report_parallel(df, config_df, processes=workers)
+            elapsed = time.perf_counter() - t0
+            print(
+                f"{workers:>8}{elapsed:>10.3f}{serial / elapsed:>10.2f}  "
+                f"{sections == expected}"
+            )
+
+
+if __name__ == "__main__":
+    main()
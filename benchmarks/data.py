@@ -0,0 +1,50 @@
+"""Synthetic input + report_config used by the benchmark scripts."""
+import os
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ["name", "hours", "phone", "address", "website", "category", "photos", "menu"]
+
+
+def make_benchmark_data(path: str, rows: int = 1_000_000, seed: int = 0) -> str:
+    rng = np.random.default_rng(seed)
+    n_tokens = rng.integers(1, 9, rows)
+    picks = rng.integers(0, len(FIELDS), n_tokens.sum())
+    tokens = np.array(FIELDS, dtype=object)[picks]
+    bounds = np.concatenate(([0], np.cumsum(n_tokens)))
+    edited = ["|".join(tokens[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+    df = pd.DataFrame(
+        {
+            "Place ID": rng.integers(0, rows // 2, rows),
+            "Ticket Type": rng.choice(["Edit", "Add", "Remove", "Close"], rows),
+            "Edited Fields": edited,
+            "Popularity": rng.integers(0, 100, rows),
+            "Score": np.round(rng.random(rows) * 100, 1),
+            "Country": rng.choice(["US", "CA", "MX", "GB", "FR", "DE"], rows),
+            "Resolution": rng.choice(
+                ["fixed. ok", "wontfix. no", "dup. yes", "fixed. partial"], rows
+            ),
+        }
+    )
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    df.to_csv(path, index=False)
+    return path
+
+
+def write_benchmark_config(path: str, input_path: str, output_path: str) -> str:
+    lines = [
+        f"INPUT,{input_path},,,,,,,",
+        f"OUTPUT,{output_path},,,,,,,",
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN",
+        "ticket_type,,yes,,,,,,",
+        "edited_fields,,,,|,yes,,,",
+        "resolution,,yes,yes,.,,,,",
+        "resolution,fixed,,yes,.,,,,",
+        "country,us,,,,,,,",
+        "place_id,,,,,,yes,,",
+        "score,,,,,,,yes,",
+    ]
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+    return path
@@ -1,7 +1,13 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    # python-dotenv is optional: without it only real environment variables apply
+    load_dotenv = None
+
+if load_dotenv is not None:
+    load_dotenv()
 
 DB_HOST = os.getenv("DB_HOST", "")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
@@ -4,18 +4,28 @@ import numpy as np
 import pandas as pd
 
 # ETL imports
-from auto_report_pipeline.extract import load_csv
+from auto_report_pipeline.extract import RowFilter, load_csv, load_csv_filtered
 from auto_report_pipeline.transform import generate_column_report
 from auto_report_pipeline.report_generator import assemble_report, save_report
-
-# Analyzer imports
-from csv_analyzer.correlation_scanner import (
+from auto_report_pipeline.vendors import (
     analyze_vendor_column,
     export_vendor_stats_to_csv,
-    compare_source_editor_columns,
+    load_vendor_list,
 )
-from csv_analyzer.pop import run_popularity_logistic
-from csv_analyzer.vendor_list import vendors_list
+from config.config import FILTER_COLUMN, FILTER_VALUE, REQUIRED_COLUMNS
+
+# Analyzer stages still living in csv_analyzer are imported lazily below, so
+# the report and vendor stages run without that package.
+
+
+def _vendor_list(vendor_list_path=None):
+    if vendor_list_path:
+        return load_vendor_list(vendor_list_path)
+    try:
+        from csv_analyzer.vendor_list import vendors_list
+    except ImportError:
+        return None
+    return vendors_list
 
 
 def pipeline_main(
@@ -24,23 +34,43 @@ def pipeline_main(
     analytics_report_path,
     vendor_stats_path,
     correlation_output_path,
+    vendor_list_path=None,
 ):
     # ─── 1) ETL: generate Analytics_Report.csv ─────────────────────────────
-    df = load_csv(raw_csv_path)
+    # Required columns are checked on the header; rows are filtered while reading
+    df, load_stats = load_csv_filtered(
+        raw_csv_path, RowFilter(tuple(REQUIRED_COLUMNS), FILTER_COLUMN, FILTER_VALUE)
+    )
     cfg = load_csv(report_config_path)
-    report_blocks = generate_column_report(df, cfg)
+    report_blocks = [
+        [
+            ["Rows read", "", load_stats["rows_read"]],
+            ["Rows kept", "", load_stats["rows_kept"]],
+        ]
+    ] + generate_column_report(df, cfg)
     analytics_df = assemble_report(report_blocks)
     save_report(analytics_df, analytics_report_path)
 
     # ─── 2) Vendor Analysis ────────────────────────────────────────────────
-    vendor_counts, vendor_dups, vendor_dup_rows = analyze_vendor_column(
-        df, "vendors", vendors_list
-    )
-    export_vendor_stats_to_csv(
-        vendor_counts, vendor_dups, vendor_dup_rows, vendor_stats_path
-    )
+    vendors_list = _vendor_list(vendor_list_path)
+    if vendors_list is None:
+        print("[main] Skipping vendor analysis: no vendor list available.")
+    else:
+        vendor_counts, vendor_dups, vendor_dup_rows = analyze_vendor_column(
+            df, "vendors", vendors_list
+        )
+        export_vendor_stats_to_csv(
+            vendor_counts, vendor_dups, vendor_dup_rows, vendor_stats_path
+        )
 
     # ─── 3) Correlation Scanning ───────────────────────────────────────────
+    try:
+        from csv_analyzer.correlation_scanner import compare_source_editor_columns
+        from csv_analyzer.pop import run_popularity_logistic
+    except ImportError as e:
+        print(f"[main] Skipping correlation / popularity stages: {e}")
+        return
+
     # You’ll need to define your source/editor columns here, e.g.:
     source_cols = ["country", "modern_category", "popularity"]
     editor_cols = ["is_poi_also_a_tourist_attraction", "are_hours_seasonal"]
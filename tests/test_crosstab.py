@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from auto_report_pipeline.crosstab import LONG_HEADER, sparse_crosstab
+from auto_report_pipeline.profiling import DatasetProfile
+from auto_report_pipeline.transform import compute_correlations_and_crosstabs
+
+
+def _dense_cramers_v(a, b):
+    observed = pd.crosstab(a, b).values.astype(float)
+    total = observed.sum()
+    expected = observed.sum(axis=1, keepdims=True) @ observed.sum(axis=0, keepdims=True) / total
+    phi2 = ((observed - expected) ** 2 / expected).sum() / total
+    rows, cols = observed.shape
+    phi2c = max(0.0, phi2 - ((cols - 1) * (rows - 1)) / (total - 1))
+    rc = rows - ((rows - 1) ** 2) / (total - 1)
+    cc = cols - ((cols - 1) ** 2) / (total - 1)
+    return np.sqrt(phi2c / min(cc - 1, rc - 1))
+
+
+def _frame(n=3_000):
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 40, n)
+    return pd.DataFrame(
+        {
+            "src": [f"s{v}" for v in a],
+            "tgt": [f"t{(v + rng.integers(0, 3)) % 25}" for v in a],
+        }
+    )
+
+
+def test_sparse_crosstab_matches_dense():
+    df = _frame()
+    ctab = sparse_crosstab(df["src"], df["tgt"])
+    dense = pd.crosstab(df["src"], df["tgt"])
+    assert ctab.row_labels == list(dense.index)
+    assert ctab.col_labels == list(dense.columns)
+    assert (ctab.dense() == dense.values).all()
+    assert ctab.total == len(df)
+    assert np.isclose(ctab.cramers_v(), _dense_cramers_v(df["src"], df["tgt"]))
+
+
+def test_long_format_and_wide_cell_limit(tmp_path):
+    df = _frame()
+    long_path = tmp_path / "long.csv"
+    compute_correlations_and_crosstabs(
+        df, ["src"], ["tgt"],
+        crosstab_output_path=str(long_path),
+        correlations_output_path=str(tmp_path / "corr.csv"),
+        crosstab_format="long",
+        verbose=False,
+        profiles=DatasetProfile(df),
+    )
+    long_df = pd.read_csv(long_path)
+    assert list(long_df.columns) == LONG_HEADER
+    assert long_df["count"].sum() == len(df)
+    assert (long_df["count"] > 0).all()
+
+    wide_path = tmp_path / "wide.csv"
+    compute_correlations_and_crosstabs(
+        df, ["src"], ["tgt"],
+        crosstab_output_path=str(wide_path),
+        correlations_output_path=str(tmp_path / "corr.csv"),
+        max_crosstab_cells=100,
+        verbose=False,
+        profiles=DatasetProfile(df),
+    )
+    lines = wide_path.read_text().splitlines()
+    assert lines[0] == "=== Crosstab (long): src vs tgt [40x25] ==="
+    assert lines[1] == "src,tgt,count"
+    assert len(lines) - 3 == len(long_df)
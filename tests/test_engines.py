@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from auto_report_pipeline.extract import load_csv
+from auto_report_pipeline.transform import generate_column_report
+
+pa = pytest.importorskip("pyarrow")
+
+
+def _config(tmp_path):
+    cfg = tmp_path / "cfg.csv"
+    cfg.write_text(
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN\n"
+        "ticket_type,,yes,,,,,,\n"
+        "edited_fields,,,,|,yes,,,\n"
+        "resolution,,yes,yes,.,,,,\n"
+        "country,us,,,,,,,\n"
+        "place_id,,,,,,yes,,\n"
+        "notes,,,,,,,,yes\n"
+    )
+    return load_csv(str(cfg))
+
+
+def test_pyarrow_engine_matches_default(tmp_path):
+    data = tmp_path / "in.csv"
+    pd.DataFrame(
+        {
+            "Place ID": [1, 2, 2, 3],
+            "Ticket Type": ["Edit", " Add ", "Edit", ""],
+            "Edited Fields": ["name|hours", "", "Hours | phone", "name"],
+            "Resolution": ["fixed. ok", "dup. yes", "fixed . no", None],
+            "Country": ["US", "CA", "US|MX", "us"],
+            "Notes": ["a-b!", "c  d", None, "#e"],
+        }
+    ).to_csv(data, index=False)
+    config_df = _config(tmp_path)
+
+    default_df = load_csv(str(data))
+    arrow_df = load_csv(str(data), engine="pyarrow")
+    assert isinstance(arrow_df["ticket_type"].dtype, pd.ArrowDtype)
+    assert arrow_df["ticket_type"].isna().sum() == 1
+
+    expected = generate_column_report(default_df, config_df)
+    assert generate_column_report(arrow_df, config_df) == expected
+
+
+def test_engines_render_numbers_and_booleans_alike(tmp_path):
+    data = tmp_path / "in.csv"
+    data.write_text(
+        "place_id,score,flag,visits\n"
+        "1,1.0,True,3\n"
+        ",2.5,False,\n"
+        "3,,True,4\n"
+        "3,4.0,True,3\n"
+    )
+    cfg = tmp_path / "cfg.csv"
+    cfg.write_text(
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN\n"
+        "place_id,,,,,,yes,,\n"
+        "score,,yes,,,,,,\n"
+        "flag,,yes,,,,,,\n"
+        "visits,,,,,,,yes,\n"
+    )
+    config_df = load_csv(str(cfg))
+
+    arrow_df = load_csv(str(data), engine="pyarrow")
+    assert str(arrow_df["place_id"].dtype) == "int64[pyarrow]"
+    expected = generate_column_report(load_csv(str(data)), config_df)
+    assert generate_column_report(arrow_df, config_df) == expected
+    assert ["", "3.0", 2] in expected[1]
+
+
+def test_pyarrow_failure_is_reported(tmp_path, capsys):
+    data = tmp_path / "in.csv"
+    data.write_text("a,b\n1,2\n3,4,5\n")
+    with pytest.raises(Exception):
+        # The default reader rejects the ragged row too, after the fallback
+        load_csv(str(data), engine="pyarrow")
+    assert "pyarrow read failed" in capsys.readouterr().out
+
+
+def test_unknown_engine_rejected(tmp_path):
+    data = tmp_path / "in.csv"
+    data.write_text("a\n1\n")
+    with pytest.raises(ValueError):
+        load_csv(str(data), engine="polars")
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from auto_report_pipeline.extract import RowFilter, load_csv, load_csv_filtered, read_header
+from auto_report_pipeline.transform import transform_data
+
+
+def _data(tmp_path, n=100):
+    path = tmp_path / "in.csv"
+    pd.DataFrame(
+        {
+            "Place ID": range(n),
+            "Ticket Type": ["Edit", "Add", " ", "Remove"] * (n // 4),
+            "All Customer Suggested Fields Edited": ["Yes", "no", "YES ", "No"] * (n // 4),
+            "Popularity": [1.5, None, 3.0, 4.0] * (n // 4),
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+def test_chunked_filter_matches_filter_after_load(tmp_path):
+    path = _data(tmp_path)
+    row_filter = RowFilter(
+        required_columns=("place_id", "ticket_type"),
+        filter_column="all_customer_suggested_fields_edited",
+        filter_value="yes",
+    )
+    df, stats = load_csv_filtered(path, row_filter, chunk_rows=7)
+    expected = transform_data(
+        load_csv(path),
+        ["place_id", "ticket_type"],
+        "all_customer_suggested_fields_edited",
+        "yes",
+    ).reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert stats == {"rows_read": 100, "rows_kept": 50}
+
+
+def test_missing_required_column_fails_on_header(tmp_path):
+    path = tmp_path / "in.csv"
+    # The body is never parsed: a missing header column fails first
+    path.write_text('place_id,popularity\n1,"unterminated\n')
+    assert read_header(str(path)) == ["place_id", "popularity"]
+    with pytest.raises(ValueError, match="ticket_type"):
+        load_csv_filtered(str(path), RowFilter(required_columns=("ticket_type",)))
+
+
+def _zip_data(tmp_path):
+    # Digits-only zip codes in the first chunks, text only at the end
+    path = tmp_path / "zips.csv"
+    rows = ["zip,ticket_type,visits"]
+    rows += [f"{z},Edit,{i % 3 or ''}" for i, z in enumerate(["02134", "00501"] * 10)]
+    rows += ["K1A 0B1,Edit,7", "02134,,1"]
+    path.write_text("\n".join(rows) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("engine", ["default", "pyarrow"])
+def test_chunked_load_keeps_types_of_full_read(tmp_path, monkeypatch, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+        import auto_report_pipeline.extract as extract
+
+        stream = extract._iter_pyarrow_chunks
+        monkeypatch.setattr(
+            extract, "_iter_pyarrow_chunks", lambda path: stream(path, block_bytes=64)
+        )
+    path = _zip_data(tmp_path)
+    row_filter = RowFilter(required_columns=("ticket_type",))
+    df, stats = load_csv_filtered(path, row_filter, engine=engine, chunk_rows=4)
+    expected = transform_data(load_csv(path, engine=engine), ["ticket_type"])
+
+    assert stats == {"rows_read": 22, "rows_kept": 21}
+    assert df["zip"].value_counts().to_dict() == {"02134": 10, "00501": 10, "K1A 0B1": 1}
+    assert df["zip"].tolist() == expected["zip"].tolist()
+    assert df["visits"].dtype == expected["visits"].dtype
+    assert df["visits"].astype(str).tolist() == expected["visits"].astype(str).tolist()
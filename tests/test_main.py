@@ -0,0 +1,48 @@
+import pandas as pd
+
+from config.config import REQUIRED_COLUMNS
+from main import pipeline_main
+
+
+def test_pipeline_main_runs_report_and_vendor_stages(tmp_path):
+    n = 8
+    data = pd.DataFrame({col: [f"{col}-{i}" for i in range(n)] for col in REQUIRED_COLUMNS})
+    data["ticket_type"] = ["Edit", "Add"] * (n // 2)
+    data["all_customer_suggested_fields_edited"] = ["No"] * (n - 2) + ["Yes", "yes"]
+    data["vendors"] = ["Yelp|Google", "google maps", "Yelp, yelp", None] * (n // 4)
+    raw = tmp_path / "raw.csv"
+    data.to_csv(raw, index=False)
+
+    cfg = tmp_path / "report_config.csv"
+    cfg.write_text(
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN\n"
+        "ticket_type,,yes,,,,,,\n"
+    )
+    vendor_list = tmp_path / "vendors.txt"
+    vendor_list.write_text("Vendor\nGoogle\nGoogle Maps\nYelp\n")
+
+    report = tmp_path / "Analytics_Report.csv"
+    vendor_stats = tmp_path / "vendor_stats.csv"
+    pipeline_main(
+        raw_csv_path=str(raw),
+        report_config_path=str(cfg),
+        analytics_report_path=str(report),
+        vendor_stats_path=str(vendor_stats),
+        correlation_output_path=str(tmp_path / "correlation_results.csv"),
+        vendor_list_path=str(vendor_list),
+    )
+
+    lines = report.read_text().splitlines()
+    # FILTER_VALUE "Yes" drops the last two rows
+    assert lines[:2] == ["Rows read,,8", "Rows kept,,6"]
+    assert "edit,50.00%,3" in lines
+
+    stats = vendor_stats.read_text().splitlines()
+    assert stats[:5] == [
+        "=== Vendor counts ===",
+        "Vendor,Rows",
+        "Yelp,3",
+        "Google,2",
+        "Google Maps,2",
+    ]
+    assert "=== Duplicate rows ===" in stats
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from auto_report_pipeline.parallel import (
+    generate_column_report_parallel,
+    row_partitions,
+)
+from auto_report_pipeline.transform import generate_column_report
+
+
+def test_row_partitions_cover_all_rows():
+    assert row_partitions(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert row_partitions(2, 8) == [(0, 1), (1, 2)]
+    assert row_partitions(0, 4) == [(0, 0)]
+
+
+def test_partitioned_report_matches_single_pass():
+    n = 300
+    df = pd.DataFrame(
+        {
+            "ticket_type": ["Edit", "add ", "Remove", None, "edit"] * (n // 5),
+            "edited_fields": ["name|Hours", "", "phone | name", "hours", "x|"]
+            * (n // 5),
+            "resolution": ["fixed. ok", "dup. yes", "fixed. no", "open", ""] * (n // 5),
+            "place_id": [str(i % 97) for i in range(n)],
+            "score": [f"{i % 13}.5" for i in range(n)],
+            "notes": ["a-b!", "c  d", None, "#e", "f"] * (n // 5),
+        }
+    )
+    cfg = pd.DataFrame(
+        [
+            ["ticket_type", None, "yes", None, None, None, None, None, None],
+            ["edited_fields", None, None, None, "|", "yes", None, None, None],
+            ["resolution", None, "yes", "yes", ".", None, None, None, None],
+            ["resolution", "fixed", None, "yes", ".", None, None, None, None],
+            ["place_id", None, None, None, None, None, "yes", None, None],
+            ["score", None, None, None, None, None, None, "yes", None],
+            ["notes", None, None, None, None, None, None, None, "yes"],
+        ],
+        columns=[
+            "column",
+            "value",
+            "aggregate",
+            "root_only",
+            "delimiter",
+            "separate_nodes",
+            "duplicate",
+            "average",
+            "clean",
+        ],
+    )
+    expected = generate_column_report(df, cfg)
+    assert generate_column_report_parallel(df, cfg, processes=1, partitions=7) == expected
+    assert generate_column_report_parallel(df, cfg, processes=2, partitions=5) == expected
+
+
+def test_partitioned_average_is_close_to_single_pass_on_large_column():
+    rng = np.random.default_rng(3)
+    values = rng.lognormal(4, 1, 120_000)
+    df = pd.DataFrame({"score": [f"{v:.3f}" for v in values]})
+    df.loc[::1000, "score"] = "n/a"
+    cfg = pd.DataFrame(
+        [["score", None, None, None, None, None, None, "yes", None]],
+        columns=[
+            "column",
+            "value",
+            "aggregate",
+            "root_only",
+            "delimiter",
+            "separate_nodes",
+            "duplicate",
+            "average",
+            "clean",
+        ],
+    )
+    expected = generate_column_report(df, cfg)
+    section = expected[1]
+    assert [row[0] for row in section] == [
+        "SCORE",
+        "Mean",
+        "Median",
+        "P90",
+        "P99",
+        "Std dev",
+        "Min",
+        "Max",
+        "Count",
+        "Non-numeric",
+    ]
+    parsed = pd.to_numeric(df["score"], errors="coerce").dropna()
+    assert section[1][2] == f"{parsed.mean():.2f}"
+    assert section[5][2] == f"{parsed.std():.2f}"
+    assert section[8][2] == len(parsed)
+    assert section[9][2] == 120
+    # Above the digest's exact limit percentiles are approximate
+    for row, q in ((2, 0.5), (3, 0.9), (4, 0.99)):
+        assert abs(float(section[row][2]) / parsed.quantile(q) - 1) < 0.01
+
+    partitioned = generate_column_report_parallel(df, cfg, processes=1, partitions=8)[1]
+    for row, got in zip(section, partitioned):
+        assert row[0] == got[0]
+        if row[0] in ("Median", "P90", "P99"):
+            assert abs(float(got[2]) / float(row[2]) - 1) < 0.01
+        else:
+            assert got == row
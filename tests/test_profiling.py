@@ -0,0 +1,62 @@
+import pandas as pd
+
+from auto_report_pipeline.profiling import DatasetProfile, profile_column
+from auto_report_pipeline.transform import (
+    compute_correlations_and_crosstabs,
+    generate_column_report,
+)
+
+
+def test_profile_column_summary():
+    prof = profile_column(pd.Series(["1", "2%", None, "2%"], name="rate"))
+    assert prof.kind == "text"
+    assert (prof.rows, prof.null_count, prof.distinct_count) == (4, 1, 2)
+    assert prof.numeric_parseable
+    assert (prof.min, prof.max) == (1.0, 2.0)
+    assert prof.top_values[0] == ("2%", 2)
+
+
+def test_profiles_do_not_change_report():
+    df = pd.DataFrame(
+        {
+            "place_id": ["a", "b", "c", "d"],
+            "score": ["1", "2", None, "4"],
+            "ticket_type": ["x", "y", "x", "x"],
+        }
+    )
+    cfg = pd.DataFrame(
+        {
+            "column": ["place_id", "score", "ticket_type"],
+            "duplicate": ["yes", None, None],
+            "average": [None, "yes", None],
+            "aggregate": [None, None, "yes"],
+        }
+    )
+    expected = generate_column_report(df, cfg)
+    profiles = DatasetProfile(df)
+    assert generate_column_report(df, cfg, profiles=profiles) == expected
+    # The report only reuses profiles computed elsewhere (insights, PROFILE)
+    assert not profiles._profiles
+    profiles["place_id"]
+    assert generate_column_report(df, cfg, profiles=profiles) == expected
+
+
+def test_insights_skip_near_unique_columns(tmp_path):
+    n = 200
+    df = pd.DataFrame(
+        {
+            "place_id": [f"id-{i}" for i in range(n)],
+            "country": ["us", "ca"] * (n // 2),
+            "resolution": ["fixed", "open"] * (n // 2),
+        }
+    )
+    result = compute_correlations_and_crosstabs(
+        df,
+        ["place_id", "country"],
+        ["resolution"],
+        crosstab_output_path=str(tmp_path / "ctab.csv"),
+        correlations_output_path=str(tmp_path / "corr.csv"),
+        profiles=DatasetProfile(df),
+    )
+    assert list(result["Source Column"]) == ["country"]
+    assert "place_id" not in (tmp_path / "ctab.csv").read_text()
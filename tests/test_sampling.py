@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from auto_report_pipeline.profiling import DatasetProfile
+from auto_report_pipeline.sampling import draw_sample, fisher_interval, sample_rows
+from auto_report_pipeline.transform import compute_correlations_and_crosstabs
+
+
+def test_stratified_sample_is_seeded_and_proportional():
+    df = pd.DataFrame({"group": ["a"] * 900 + ["b"] * 100, "x": range(1000)})
+    assert sample_rows(1000, 0.1) == 100 and sample_rows(1000, 250) == 250
+    first = draw_sample(df, 100, seed=3, stratify="group")
+    again = draw_sample(df, 100, seed=3, stratify="group")
+    assert first.equals(again)
+    assert first["group"].value_counts().to_dict() == {"a": 90, "b": 10}
+    assert first.index.is_monotonic_increasing
+
+
+def test_fisher_interval_contains_estimate():
+    lo, hi = fisher_interval(0.5, 1000)
+    assert lo < 0.5 < hi and hi - lo < 0.11
+
+
+def test_sampled_insights_recheck_only_straddling_pairs(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 50_000
+    x = rng.normal(size=n)
+    df = pd.DataFrame(
+        {
+            "x": x,
+            "strong": x + rng.normal(scale=0.5, size=n),
+            "border": 0.2 * x + rng.normal(scale=0.98, size=n),
+            "noise": rng.normal(size=n),
+            "cat": np.where(x > 0, "pos", "neg"),
+            "label": np.where(x + rng.normal(scale=0.3, size=n) > 0, "up", "down"),
+        }
+    )
+    out = compute_correlations_and_crosstabs(
+        df,
+        ["x", "cat"],
+        ["strong", "border", "noise", "label"],
+        crosstab_output_path=str(tmp_path / "ct.csv"),
+        correlations_output_path=str(tmp_path / "corr.csv"),
+        profiles=DatasetProfile(df),
+        sample=2_000,
+        sample_seed=1,
+        verbose=False,
+    )
+    rows = {(r["Source Column"], r["Target Column"]): r for r in out.to_dict("records")}
+    assert rows[("x", "strong")]["Basis"] == "sample"
+    assert rows[("x", "strong")]["CI Low"] >= 0.2
+    assert rows[("cat", "label")]["Basis"] == "sample"
+    assert ("x", "noise") not in rows
+    # r ~ 0.2: the sample interval straddles the threshold, so it is settled on all rows
+    assert rows[("x", "border")]["Basis"] == "full"
+    assert rows[("x", "border")]["Rows"] == n
+    # Mixed (categorical x numeric) pairs have no sample interval
+    assert rows[("cat", "strong")]["Basis"] == "full"
+    assert rows[("cat", "strong")]["Rows"] == n
+    written = pd.read_csv(tmp_path / "corr.csv")
+    assert {"CI Low", "CI High", "Basis", "Rows"} <= set(written.columns)
+
+
+def test_sampled_insights_recheck_pairs_undefined_on_the_sample(tmp_path):
+    n = 5_000
+    src = np.where(np.arange(n) % 500 == 0, "rare", "common")
+    df = pd.DataFrame({"src": src, "tgt": np.where(src == "rare", "b", "a")})
+    out = compute_correlations_and_crosstabs(
+        df,
+        ["src"],
+        ["tgt"],
+        crosstab_output_path=str(tmp_path / "ct.csv"),
+        correlations_output_path=str(tmp_path / "corr.csv"),
+        profiles=DatasetProfile(df),
+        sample=50,
+        verbose=False,
+    )
+    # The sample has no "rare" row, so V is undefined there; on all rows it is 1
+    assert out.to_dict("records") == [
+        {
+            "Source Column": "src",
+            "Target Column": "tgt",
+            "Correlation": 1.0,
+            "CI Low": "",
+            "CI High": "",
+            "Basis": "full",
+            "Rows": n,
+        }
+    ]
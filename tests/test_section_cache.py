@@ -0,0 +1,53 @@
+import pandas as pd
+
+from auto_report_pipeline.section_cache import SectionCache
+from auto_report_pipeline.transform import generate_column_report
+
+
+def _config(rows):
+    return pd.DataFrame(
+        rows, columns=["column", "value", "aggregate", "delimiter", "separate_nodes"]
+    )
+
+
+DATA = pd.DataFrame(
+    {
+        "ticket_type": ["edit", "add", "edit"],
+        "edited_fields": ["name|hours", "hours", "phone"],
+    }
+)
+
+
+def test_only_changed_sections_recompute(tmp_path):
+    cfg = _config(
+        [
+            ["ticket_type", None, "yes", None, None],
+            ["edited_fields", None, None, "|", "yes"],
+        ]
+    )
+    cache = SectionCache(str(tmp_path / "sections"))
+    first = generate_column_report(DATA, cfg, section_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    second = generate_column_report(DATA, cfg, section_cache=cache)
+    assert second == first
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Tweak one directive row: only that column's section is recomputed
+    cfg.loc[1, "value"] = "hours"
+    generate_column_report(DATA, cfg, section_cache=cache)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    # Changing the data of one column invalidates just that section
+    changed = DATA.assign(ticket_type=["edit", "add", "add"])
+    result = generate_column_report(changed, cfg, section_cache=cache)
+    assert (cache.hits, cache.misses) == (4, 4)
+    assert result == generate_column_report(changed, cfg)
+
+
+def test_cache_is_capped(tmp_path):
+    cfg = _config([["ticket_type", None, "yes", None, None]])
+    cache = SectionCache(str(tmp_path / "sections"), max_bytes=1)
+    generate_column_report(DATA, cfg, section_cache=cache)
+    assert cache.evictions == 1
+    assert not list((tmp_path / "sections").glob("*.pkl"))
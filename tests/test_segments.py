@@ -0,0 +1,98 @@
+import pandas as pd
+
+from auto_report_pipeline.segments import (
+    generate_segmented_report,
+    segment_output_path,
+    segment_output_paths,
+)
+from auto_report_pipeline.transform import generate_column_report
+
+COLUMNS = [
+    "column",
+    "value",
+    "aggregate",
+    "root_only",
+    "delimiter",
+    "separate_nodes",
+    "duplicate",
+    "average",
+    "clean",
+]
+
+
+def _frame(n=200):
+    return pd.DataFrame(
+        {
+            "ticket_type": ["Edit", "Add", "Remove", None, "Edit"] * (n // 5),
+            "edited_fields": ["name|Hours", "", "phone | name", "hours", "x|"] * (n // 5),
+            "resolution": ["fixed. ok", "dup. yes", "fixed. no", "open", ""] * (n // 5),
+            "category": ["a|b", "b", "c|a", "", "a"] * (n // 5),
+            "place_id": [str(i % 37) for i in range(n)],
+            "score": [f"{i % 13}.5" for i in range(n)],
+            "notes": ["a-b!", "c  d", None, "#e", "f"] * (n // 5),
+        }
+    )
+
+
+def _config():
+    return pd.DataFrame(
+        [
+            ["edited_fields", None, None, None, "|", "yes", None, None, None],
+            ["resolution", None, "yes", "yes", ".", None, None, None, None],
+            ["category", "a", None, None, "|", "yes", None, None, None],
+            ["category", "b", None, None, None, None, None, None, None],
+            ["place_id", None, None, None, None, None, "yes", None, None],
+            ["score", None, None, None, None, None, None, "yes", None],
+            ["notes", None, None, None, None, None, None, None, "yes"],
+        ],
+        columns=COLUMNS,
+    )
+
+
+def test_segment_reports_match_filtered_runs():
+    df, cfg = _frame(), _config()
+    _, per_segment = generate_segmented_report(df, cfg, "Ticket Type")
+    assert list(per_segment) == ["None", "Add", "Edit", "Remove"]
+    segment = df["ticket_type"].fillna("").str.strip()
+    for name, sections in per_segment.items():
+        subset = df[segment == ("" if name == "None" else name)].reset_index(drop=True)
+        assert sections == generate_column_report(subset, cfg)
+
+
+def test_combined_report_adds_segment_columns():
+    df, cfg = _frame(), _config()
+    combined = generate_column_report(df, cfg, segment_by="ticket_type")
+    overall = generate_column_report(df, cfg)
+    assert combined[0] == [["Total rows", "", 200, 40, 40, 80, 40]]
+    for wide, plain in zip(combined[1:], overall[1:]):
+        assert [row[:3] for row in wide] == plain
+    edited = combined[1]
+    assert edited[0][3:7] == ["None %", "None Count", "Add %", "Add Count"]
+    name_row = next(row for row in edited if row[0] == "name")
+    # "name" appears in Edit (x2 per 5 rows) and Remove rows only
+    assert name_row[3:] == ["0.00%", 0, "0.00%", 0, "50.00%", 40, "100.00%", 40]
+
+
+def test_segment_output_path():
+    assert segment_output_path("out/report.csv", "Add") == "out/report_Add.csv"
+    assert segment_output_path("report.csv", "a/b c") == "report_a_b_c.csv"
+
+
+def test_blank_and_literal_none_segments_stay_apart():
+    df = pd.DataFrame({"status": ["None", "", None, "open", "None"], "x": list("abcde")})
+    cfg = pd.DataFrame(
+        [["x", None, "yes", None, None, None, None, None, None]], columns=COLUMNS
+    )
+    _, per_segment = generate_segmented_report(df, cfg, "status")
+    assert list(per_segment) == ["(blank)", "None", "open"]
+    assert [blocks[0][0][2] for blocks in per_segment.values()] == [2, 2, 1]
+
+
+def test_segment_output_paths_never_collide():
+    paths = segment_output_paths("out/report.csv", ["a/b", "a_b", "A_B", "c"])
+    assert paths == {
+        "a/b": "out/report_a_b.csv",
+        "a_b": "out/report_a_b_2.csv",
+        "A_B": "out/report_A_B_3.csv",
+        "c": "out/report_c.csv",
+    }
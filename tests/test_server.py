@@ -0,0 +1,99 @@
+import json
+import threading
+import urllib.request
+
+import pandas as pd
+
+from auto_report_pipeline.server import DatasetCache, make_server
+
+
+def _write_inputs(tmp_path):
+    data = tmp_path / "in.csv"
+    pd.DataFrame({"ticket_type": ["a", "b", "a", "a"]}).to_csv(data, index=False)
+    cfg = tmp_path / "cfg.csv"
+    cfg.write_text(
+        "INPUT,in.csv,,,,,,,\n"
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN\n"
+        "ticket_type,,yes,,,,,,\n"
+    )
+    return data, cfg
+
+
+def _post(url, payload):
+    req = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(req) as resp:
+        return resp.read().decode("utf-8")
+
+
+def test_server_returns_report_and_reuses_cache(tmp_path):
+    _, cfg = _write_inputs(tmp_path)
+    httpd = make_server(port=0, max_workers=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{httpd.server_address[1]}/report"
+        first = _post(url, {"config_path": str(cfg)})
+        second = _post(url, {"config_path": str(cfg)})
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        httpd.service.shutdown()
+
+    assert "a,75.00%,3" in first
+    assert first == second
+    stats = httpd.service.stats()
+    assert stats["cache"]["misses"] == 1
+    assert stats["cache"]["hits"] == 1
+
+
+def test_identical_concurrent_requests_are_coalesced(tmp_path, monkeypatch):
+    data, cfg = _write_inputs(tmp_path)
+    httpd = make_server(port=0, max_workers=2)
+    service = httpd.service
+    gate = threading.Event()
+    original = service._compute
+
+    def _slow_compute(*args):
+        gate.wait(5)
+        return original(*args)
+
+    monkeypatch.setattr(service, "_compute", _slow_compute)
+    try:
+        futures = [service.submit(str(cfg)) for _ in range(3)]
+        gate.set()
+        results = [f.result(5) for f in futures]
+    finally:
+        httpd.server_close()
+        service.shutdown()
+
+    assert len(set(results)) == 1
+    assert service.computed == 1
+    assert service.coalesced == 2
+
+
+def test_dataset_cache_evicts_over_budget(tmp_path):
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"in{i}.csv"
+        pd.DataFrame({"x": [f"value-{i}-{j}" for j in range(200)]}).to_csv(
+            p, index=False
+        )
+        paths.append(str(p))
+
+    cache = DatasetCache(max_bytes=1)
+    cache.get(paths[0])
+    assert cache.stats()["entries"] == 0
+
+    one = cache.get(paths[0]).memory_usage(deep=True).sum()
+    cache = DatasetCache(max_bytes=int(one * 2.5))
+    for p in paths:
+        cache.get(p)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= cache.max_bytes
+    cache.get(paths[2])
+    assert cache.stats()["hits"] == 1
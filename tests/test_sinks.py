@@ -0,0 +1,117 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+from auto_report_pipeline.crosstab import LONG_HEADER
+from auto_report_pipeline.profiling import DatasetProfile
+from auto_report_pipeline.report_generator import assemble_report, save_report
+from auto_report_pipeline.sinks import (
+    TableSink,
+    available_output_format,
+    open_csv_sink,
+    output_path_for,
+)
+from auto_report_pipeline.transform import compute_correlations_and_crosstabs
+
+
+def _report():
+    return assemble_report(
+        [[["Total rows", "", 3]], [["Ticket", "", "Count"], ["Edit", "66.67%", 2]]]
+    )
+
+
+def test_output_path_for_swaps_known_extensions():
+    assert output_path_for("out/report.csv", "csv.gz") == "out/report.csv.gz"
+    assert output_path_for("out/report.csv.gz", "parquet") == "out/report.parquet"
+    assert output_path_for("out/report", "jsonl") == "out/report.jsonl"
+    assert output_path_for("out/report.csv", "csv") == "out/report.csv"
+
+
+def test_unknown_and_unavailable_formats():
+    with pytest.raises(ValueError):
+        available_output_format("xlsx")
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        assert available_output_format("csv.zst") == "csv.gz"
+    assert available_output_format(None) == "csv"
+
+
+def test_gzip_report_matches_plain_csv(tmp_path):
+    plain = save_report(_report(), str(tmp_path / "report.csv"))
+    packed = save_report(_report(), str(tmp_path / "report.csv"), "csv.gz")
+    assert packed.endswith("report.csv.gz")
+    with gzip.open(packed, "rt", newline="") as fh:
+        assert fh.read() == open(plain, newline="").read()
+
+
+def test_gzip_sinks_are_reproducible(tmp_path):
+    paths = []
+    for run in ("a", "b"):
+        (tmp_path / run).mkdir()
+        path = str(tmp_path / run / "report.csv.gz")
+        with open_csv_sink(path, "csv.gz") as fh:
+            fh.write("a,b\r\n1,2\r\n")
+        paths.append(path)
+    first, second = (open(p, "rb").read() for p in paths)
+    assert first == second
+    assert first[4:8] == b"\x00\x00\x00\x00"  # header mtime
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "parquet"])
+def test_table_sink_appends_pieces(tmp_path, fmt):
+    if fmt == "parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / f"crosstabs.{fmt}")
+    pieces = [
+        pd.DataFrame([["a", "b", "x", "y", 3]], columns=LONG_HEADER),
+        pd.DataFrame([["a", "c", "x", "z", 1], ["a", "c", "w", "z", 2]], columns=LONG_HEADER),
+    ]
+    with TableSink(path, fmt, LONG_HEADER) as sink:
+        for piece in pieces:
+            sink.write(piece)
+    if fmt == "parquet":
+        assert pq.ParquetFile(path).num_row_groups == 2
+        back = pd.read_parquet(path)
+    else:
+        back = pd.read_json(path, lines=True, dtype=False)
+    assert list(back.columns) == LONG_HEADER
+    assert back["count"].tolist() == [3, 1, 2]
+    assert back["target_column"].tolist() == ["b", "c", "c"]
+
+
+def test_jsonl_report_keeps_cells_as_text(tmp_path):
+    path = save_report(_report(), str(tmp_path / "report.csv"), "jsonl")
+    back = pd.read_json(path, lines=True, dtype=False)
+    assert list(back.columns) == ["c0", "c1", "c2"]
+    assert back.iloc[3].tolist() == ["Edit", "66.67%", "2"]
+
+
+@pytest.mark.parametrize("fmt", ["csv.gz", "jsonl", "parquet"])
+def test_insights_files_round_trip(tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {"src": ["a", "b", "c", "a", "b"] * 40, "tgt": ["x", "y", "y", "x", "z"] * 40}
+    )
+    ctab_path = output_path_for(str(tmp_path / "crosstabs_output.csv"), fmt)
+    corr_path = output_path_for(str(tmp_path / "correlation_results.csv"), fmt)
+    results = compute_correlations_and_crosstabs(
+        df, ["src"], ["tgt"],
+        crosstab_output_path=ctab_path,
+        correlations_output_path=corr_path,
+        crosstab_format="long",
+        verbose=False,
+        profiles=DatasetProfile(df),
+        output_format=fmt,
+    )
+    read = {
+        "csv.gz": pd.read_csv,
+        "jsonl": lambda p: pd.read_json(p, lines=True),
+        "parquet": pd.read_parquet,
+    }[fmt]
+    crosstabs = read(ctab_path)
+    assert list(crosstabs.columns) == LONG_HEADER
+    assert crosstabs["count"].sum() == len(df)
+    assert read(corr_path)["Correlation"].tolist() == results["Correlation"].tolist()
@@ -0,0 +1,39 @@
+import numpy as np
+
+from auto_report_pipeline.sketch import NumericSummary, TDigest
+
+
+def test_small_column_quantiles_are_exact():
+    values = np.random.default_rng(0).normal(50, 10, 1_000)
+    digest = TDigest().update(values)
+    assert digest.exact
+    for q in (0.5, 0.9, 0.99):
+        assert digest.quantile(q) == np.quantile(values, q)
+
+
+def test_merged_digests_approximate_quantiles():
+    rng = np.random.default_rng(1)
+    values = rng.lognormal(3, 1, 400_000)
+    merged = TDigest()
+    for part in np.array_split(values, 8):
+        merged.merge(TDigest(exact_limit=10_000).update(part))
+    assert not merged.exact
+    assert merged.means.size < 1_000
+    for q in (0.5, 0.9, 0.99):
+        exact = np.quantile(values, q)
+        assert abs(merged.quantile(q) - exact) / exact < 0.02
+
+
+def test_summary_merge_matches_single_pass():
+    rng = np.random.default_rng(2)
+    values = rng.uniform(0, 100, 10_000)
+    whole = NumericSummary().update(values, non_numeric=3)
+    merged = NumericSummary()
+    for i, part in enumerate(np.array_split(values, 5)):
+        merged.merge(NumericSummary().update(part, non_numeric=1 if i < 3 else 0))
+    assert merged.count == whole.count == values.size
+    assert merged.non_numeric == whole.non_numeric == 3
+    assert np.isclose(merged.mean, values.mean())
+    assert np.isclose(merged.std, values.std(ddof=1))
+    assert (merged.min, merged.max) == (values.min(), values.max())
+    assert merged.quantile(0.9) == whole.quantile(0.9)
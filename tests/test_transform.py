@@ -1,7 +1,7 @@
 import pandas as pd
 import pytest
 
-from transform_data_module import transform_data, validate_schema
+from auto_report_pipeline.transform import transform_data, validate_schema
 
 
 def test_validate_schema_pass():
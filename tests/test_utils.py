@@ -0,0 +1,50 @@
+import re
+
+import pandas as pd
+
+from auto_report_pipeline.utils import count_delimited_tokens, split_delimited_tokens
+
+
+def _explode_counts(series, delimiter):
+    items = (
+        series.str.split(rf"\s*{re.escape(delimiter)}\s*", regex=True)
+        .explode()
+        .dropna()
+        .str.strip()
+        .str.lower()
+    )
+    counts = {}
+    for val in items:
+        counts[val] = counts.get(val, 0) + 1
+    return counts
+
+
+def test_matches_explode_path():
+    series = pd.Series(
+        ["Name | Hours", "", "  ", "hours||PHONE ", " a.b ", "name|", "x\x00y|name"]
+    )
+    for delim in ["|", ".", "||"]:
+        expected = _explode_counts(series, delim)
+        got = count_delimited_tokens(series, delim, chunk_rows=3)
+        assert got == expected
+        assert list(got) == list(expected)
+
+
+def test_empty_tokens_are_counted():
+    series = pd.Series(["a|", "", "a"])
+    assert count_delimited_tokens(series, "|") == {"a": 2, "": 2}
+
+
+def test_split_tokens_keep_their_rows():
+    series = pd.Series(
+        ["Name | Hours", "", "  ", "hours||PHONE ", " a.b ", "name|", "x\x00y|name"]
+    )
+    for delim in ["|", ".", "||"]:
+        tokens, rows = split_delimited_tokens(series, delim, chunk_rows=3)
+        expected = (
+            series.str.split(rf"\s*{re.escape(delim)}\s*", regex=True)
+            .explode()
+            .str.strip()
+        )
+        assert tokens == expected.tolist()
+        assert rows.tolist() == expected.index.tolist()
@@ -0,0 +1,62 @@
+import pandas as pd
+
+from auto_report_pipeline.vendors import (
+    VendorMatcher,
+    analyze_vendor_column,
+    export_vendor_stats_to_csv,
+)
+
+VENDORS = ["Google", "Google Maps", "AT&T", "Yelp", "yelp"]
+
+
+def test_matcher_prefers_longest_vendor():
+    m = VendorMatcher(VENDORS)
+    assert m.names == ["Google", "Google Maps", "AT&T", "Yelp"]
+    ids = m.match_tokens("google maps and google at t".split())
+    assert [m.names[i] for i in ids] == ["Google Maps", "Google", "AT&T"]
+
+
+def test_analyze_vendor_column(tmp_path):
+    df = pd.DataFrame(
+        {
+            "Vendors": [
+                "Google Maps|Yelp",
+                "yelp, YELP",
+                None,
+                "at&t | Google | google",
+                "unknown",
+            ]
+        }
+    )
+    counts, dups, dup_rows = analyze_vendor_column(df, "vendors", VENDORS)
+    assert counts.to_dict() == {"Yelp": 2, "Google Maps": 1, "Google": 1, "AT&T": 1}
+    assert dups.to_dict() == {"Google": 1, "Yelp": 1}
+    assert dup_rows["row"].tolist() == [1, 3]
+    assert dup_rows["duplicate_vendors"].tolist() == ["Yelp", "Google"]
+
+    out = tmp_path / "vendor_stats.csv"
+    export_vendor_stats_to_csv(counts, dups, dup_rows, str(out))
+    lines = out.read_text().splitlines()
+    assert lines[:3] == ["=== Vendor counts ===", "Vendor,Rows", "Yelp,2"]
+    assert "=== Duplicate rows ===" in lines
+
+
+def test_large_vendor_list_single_scan():
+    vendors = [f"vendor {i} inc" for i in range(20_000)]
+    df = pd.DataFrame({"vendors": [f"Vendor {i} Inc|vendor {i // 2} inc" for i in range(5_000)]})
+    counts, _, _ = analyze_vendor_column(df, "vendors", vendors)
+    assert counts["vendor 0 inc"] == 2
+    # Row 0 names "vendor 0 inc" twice; it counts once for that row
+    assert counts.sum() == 2 * 5_000 - 1
+
+
+def test_accented_and_cjk_vendor_names(capsys):
+    m = VendorMatcher(["Zürich Taxi", "Café Rouge", "Cafe Rouge", "美团", "***"])
+    assert m.names == ["Zürich Taxi", "Café Rouge", "美团"]
+    assert "'***'" in capsys.readouterr().out
+
+    df = pd.DataFrame(
+        {"vendors": ["Zurich Taxi", "ZÜRICH TAXI|café rouge", "z rich taxi", "美团, CAFE ROUGE"]}
+    )
+    counts, _, _ = analyze_vendor_column(df, "vendors", [], matcher=m)
+    assert counts.to_dict() == {"Zürich Taxi": 2, "Café Rouge": 2, "美团": 1}
@@ -0,0 +1,108 @@
+import os
+
+import pandas as pd
+
+from auto_report_pipeline.watch import ReportWatcher
+
+
+def _write_config(path, input_name, output_name, column="ticket_type"):
+    path.write_text(
+        f"INPUT,{input_name},,,,,,,\n"
+        f"OUTPUT,{output_name},,,,,,,\n"
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN\n"
+        f"{column},,yes,,,,,,\n"
+    )
+
+
+def test_watcher_reloads_only_changed_input(tmp_path):
+    data = tmp_path / "in.csv"
+    pd.DataFrame({"ticket_type": ["a", "b", "a"]}).to_csv(data, index=False)
+    cfg = tmp_path / "cfg.csv"
+    _write_config(cfg, "in.csv", "report.csv")
+
+    watcher = ReportWatcher(str(cfg), debounce=1.0, analytics=False)
+    watcher.start()
+    config_before = watcher.config_df
+    assert watcher.runs == 1
+
+    pd.DataFrame({"ticket_type": ["a", "b", "b", "b"]}).to_csv(data, index=False)
+    os.utime(data, ns=(1, 1))
+
+    # First sighting only starts the debounce window
+    assert watcher.poll(now=100.0) == set()
+    assert watcher.poll(now=101.5) == {"input"}
+    assert watcher.refresh({"input"})
+
+    assert watcher.runs == 2
+    assert watcher.config_df is config_before
+    report = (tmp_path / "report.csv").read_text()
+    assert "b,75.00%,3" in report
+
+
+def test_watcher_config_change_regenerates(tmp_path):
+    data = tmp_path / "in.csv"
+    pd.DataFrame({"ticket_type": ["a", "b"], "country": ["us", "us"]}).to_csv(
+        data, index=False
+    )
+    cfg = tmp_path / "cfg.csv"
+    _write_config(cfg, "in.csv", "report.csv")
+
+    watcher = ReportWatcher(str(cfg), debounce=0.0, analytics=False)
+    watcher.start()
+    df_before = watcher.df
+
+    _write_config(cfg, "in.csv", "report.csv", column="country")
+    os.utime(cfg, ns=(1, 1))
+    changed = watcher.poll(now=5.0)
+    assert changed == {"config"}
+    assert watcher.refresh(changed)
+
+    assert watcher.df is df_before
+    assert "COUNTRY" in (tmp_path / "report.csv").read_text()
+
+
+def test_failed_reload_keeps_previous_state(tmp_path):
+    data = tmp_path / "in.csv"
+    pd.DataFrame({"ticket_type": ["a", "b"], "country": ["us", "ca"]}).to_csv(
+        data, index=False
+    )
+    cfg = tmp_path / "cfg.csv"
+    _write_config(cfg, "in.csv", "report.csv")
+
+    watcher = ReportWatcher(str(cfg), debounce=0.0, analytics=False)
+    watcher.start()
+    before = (
+        watcher.config_df,
+        watcher.input_path,
+        watcher.output_path,
+        watcher.segment_by,
+        watcher.output_format,
+        watcher.df,
+    )
+
+    # New OUTPUT, SEGMENT BY and OUTPUT_FORMAT, but INPUT points at a missing file
+    cfg.write_text(
+        "INPUT,missing.csv,,,,,,,\n"
+        "OUTPUT,other/report.csv,,,,,,,\n"
+        "SEGMENT BY,country,,,,,,,\n"
+        "OUTPUT_FORMAT,jsonl,,,,,,,\n"
+        "COLUMN,VALUE,AGGREGATE,ROOT ONLY,DELIMITER,SEPARATE NODES,DUPLICATE,AVERAGE,CLEAN\n"
+        "country,,yes,,,,,,\n"
+    )
+    os.utime(cfg, ns=(1, 1))
+    assert not watcher.refresh(watcher.poll(now=5.0))
+
+    after = (
+        watcher.config_df,
+        watcher.input_path,
+        watcher.output_path,
+        watcher.segment_by,
+        watcher.output_format,
+        watcher.df,
+    )
+    assert all(a is b for a, b in zip(before, after))
+    assert not (tmp_path / "other").exists()
+
+    # The resident state still renders the original report
+    watcher._render("manual")
+    assert "TICKET TYPE" in (tmp_path / "report.csv").read_text()